@@ -5,13 +5,19 @@ Attempts to import the compiled _leadswarm_native module (built with maturin).
 Falls back gracefully when not available — all functions remain None and callers
 should check before use.
 
+On PyPy the extension is never loaded: calls through cpyext are slow, and the
+JIT runs the pure-Python fallbacks faster than crossing the FFI boundary.
+
 Build with: cd rust && maturin develop --release
 """
 
 import logging
+import platform
 
 _logger = logging.getLogger(__name__)
 
+_IS_PYPY = platform.python_implementation() == "PyPy"
+
 # Text processing (dedup.py / validation.py)
 normalize_domain = None
 normalize_name = None
@@ -52,6 +58,9 @@ extract_html_metadata = None
 AVAILABLE = False
 
 try:
+    if _IS_PYPY:
+        raise ImportError("native extension disabled on PyPy")
+
     import _leadswarm_native as _n
 
     normalize_domain = _n.normalize_domain
@@ -9,25 +9,23 @@ Usage:
 """
 
 import asyncio
+import heapq
 import logging
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Optional, List
 
 from prospect.config import Settings, load_config, ScraperConfig
 from prospect.scraper import SerpAPIClient, AuthenticationError
 from prospect.dedup import deduplicate_serp_results
 from prospect.enrichment.crawler import WebsiteCrawler
-from prospect.scoring import (
-    calculate_fit_score,
-    calculate_opportunity_score,
-    generate_opportunity_notes,
-)
+from prospect.scoring import generate_opportunity_notes, score_prospects
 from prospect.models import Prospect
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProspectResult:
     """Simplified result for library usage."""
 
@@ -136,18 +134,22 @@ def search_prospects(
         asyncio.run(enrich_all())
 
     # Score
+    score_prospects(prospects, fit_weight, opportunity_weight)
+
+    # Apply filters, then keep the top results by priority
+    prospects = heapq.nlargest(
+        limit,
+        (
+            p for p in prospects
+            if (not min_fit or p.fit_score >= min_fit)
+            and (not min_opportunity or p.opportunity_score >= min_opportunity)
+            and (not min_priority or p.priority_score >= min_priority)
+        ),
+        key=attrgetter("priority_score"),
+    )
     for prospect in prospects:
-        prospect.fit_score = calculate_fit_score(prospect)
-        prospect.opportunity_score = calculate_opportunity_score(prospect)
-        prospect.priority_score = (
-            prospect.fit_score * fit_weight +
-            prospect.opportunity_score * opportunity_weight
-        )
         prospect.opportunity_notes = generate_opportunity_notes(prospect)
 
-    # Sort by priority
-    prospects.sort(key=lambda p: p.priority_score, reverse=True)
-
     # Convert to ProspectResult
     results = []
     for p in prospects:
@@ -178,12 +180,4 @@ def search_prospects(
         )
         results.append(result)
 
-    # Apply filters
-    if min_fit:
-        results = [r for r in results if r.fit_score >= min_fit]
-    if min_opportunity:
-        results = [r for r in results if r.opportunity_score >= min_opportunity]
-    if min_priority:
-        results = [r for r in results if r.priority_score >= min_priority]
-
-    return results[:limit]
+    return results
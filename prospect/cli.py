@@ -27,11 +27,13 @@ Examples:
 import asyncio
 import csv
 import io
+import heapq
 import json
 import logging
 import os
 import sys
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional
 
@@ -46,7 +48,7 @@ from .models import Prospect
 from .scraper.serpapi import SerpAPIClient, AuthenticationError as SerpAuthError, SerpAPIError
 from .dedup import deduplicate_serp_results
 from .enrichment.crawler import WebsiteCrawler
-from .scoring import calculate_fit_score, calculate_opportunity_score, generate_opportunity_notes
+from .scoring import calculate_fit_score, calculate_opportunity_score, generate_opportunity_notes, score_prospects
 from .export import export_prospects
 from .sheets import SheetsExporter, SheetsError, AuthenticationError as SheetsAuthError
 
@@ -337,13 +339,8 @@ def search(
             asyncio.run(enrich_all())
 
         # Score
+        score_prospects(prospects, fit_weight, opportunity_weight)
         for prospect in prospects:
-            prospect.fit_score = calculate_fit_score(prospect)
-            prospect.opportunity_score = calculate_opportunity_score(prospect)
-            prospect.priority_score = (
-                prospect.fit_score * fit_weight +
-                prospect.opportunity_score * opportunity_weight
-            )
             prospect.opportunity_notes = generate_opportunity_notes(prospect)
 
     else:
@@ -446,23 +443,19 @@ def search(
                 prospect.opportunity_notes = generate_opportunity_notes(prospect)
                 progress.update(score_task, completed=i + 1)
 
-    # Sort by priority score
-    prospects.sort(key=lambda p: p.priority_score, reverse=True)
-
-    # Apply filters
-    if min_fit:
-        prospects = [p for p in prospects if p.fit_score >= min_fit]
-    if min_opportunity:
-        prospects = [p for p in prospects if p.opportunity_score >= min_opportunity]
-    if min_priority:
-        prospects = [p for p in prospects if p.priority_score >= min_priority]
-    if require_phone:
-        prospects = [p for p in prospects if p.phone]
-    if require_email:
-        prospects = [p for p in prospects if p.emails]
-
-    # Limit results
-    prospects = prospects[:limit]
+    # Apply filters in one pass, then keep the top results by priority score
+    prospects = heapq.nlargest(
+        limit,
+        (
+            p for p in prospects
+            if (not min_fit or p.fit_score >= min_fit)
+            and (not min_opportunity or p.opportunity_score >= min_opportunity)
+            and (not min_priority or p.priority_score >= min_priority)
+            and (not require_phone or p.phone)
+            and (not require_email or p.emails)
+        ),
+        key=attrgetter("priority_score"),
+    )
 
     if not quiet:
         console.print(f"[dim]{len(prospects)} prospects after filtering[/dim]")
@@ -580,10 +573,8 @@ def batch(queries_file: str, output_dir: str, output_format: str, skip_enrichmen
                 asyncio.run(enrich_all())
 
             # Score
+            score_prospects(prospects, fit_weight=0.5, opportunity_weight=0.5)
             for prospect in prospects:
-                prospect.fit_score = calculate_fit_score(prospect)
-                prospect.opportunity_score = calculate_opportunity_score(prospect)
-                prospect.priority_score = (prospect.fit_score + prospect.opportunity_score) / 2
                 prospect.opportunity_notes = generate_opportunity_notes(prospect)
 
             prospects.sort(key=lambda p: p.priority_score, reverse=True)
@@ -144,7 +144,7 @@ class ScoringConfig:
 
 
 # Directory domains to filter out
-DIRECTORY_DOMAINS = {
+DIRECTORY_DOMAINS = frozenset({
     # Social media
     "facebook.com",
     "linkedin.com",
@@ -156,6 +156,7 @@ DIRECTORY_DOMAINS = {
     "reddit.com",
     "quora.com",
     "pinterest.com",
+    "pinterest.com.au",
     "threads.net",
 
     # Australian directories
@@ -217,11 +218,14 @@ DIRECTORY_DOMAINS = {
     # Generic/tech
     "wikipedia.org",
     "google.com",
+    "google.com.au",
     "bing.com",
     "duckduckgo.com",
     "apple.com",
+    "apple.com.au",
     "g2.com",
     "capterra.com",
+    "capterra.com.au",
     "crunchbase.com",
     "medium.com",
     "github.com",
@@ -235,7 +239,7 @@ DIRECTORY_DOMAINS = {
     "9news.com.au",
     "7news.com.au",
     "sbs.com.au",
-}
+})
 
 # URL patterns that indicate directory/social content (even on legitimate domains)
 DIRECTORY_URL_PATTERNS = [
@@ -273,6 +277,9 @@ CMS_SIGNATURES = {
     "Drupal": ["drupal", "/sites/default/"],
 }
 
+# DIY website builders that count as a "weak" CMS when scoring
+WEAK_CMS = frozenset({"Wix", "Weebly", "GoDaddy Website Builder"})
+
 # Tracking signatures for detection
 TRACKING_SIGNATURES = {
     "google_analytics": [
@@ -344,7 +351,7 @@ SPAM_EMAIL_PATTERNS = [
 ]
 
 # Spam email domains to filter out
-SPAM_EMAIL_DOMAINS = {
+SPAM_EMAIL_DOMAINS = frozenset({
     'error-tracking.reddit.com',
     'sentry.io',
     'bugsnag.com',
@@ -363,4 +370,4 @@ SPAM_EMAIL_DOMAINS = {
     'intercom-mail.com',
     'zendesk.com',
     'freshdesk.com',
-}
+})
@@ -1,5 +1,6 @@
 """Deduplication logic for merging prospects from multiple sources."""
 
+import functools
 import logging
 import re
 from typing import Optional
@@ -16,7 +17,32 @@ from . import _native
 
 logger = logging.getLogger(__name__)
 
+# All directory URL patterns as one alternation, matched against the lowered URL
+_DIRECTORY_URL_RE = re.compile("|".join(map(re.escape, DIRECTORY_URL_PATTERNS)))
 
+# Company suffixes stripped by normalize_name, in order (stripping one can
+# expose the next, e.g. "acme co ltd"), compiled once rather than per call
+_NAME_SUFFIX_RES = tuple(
+    re.compile(rf"\s+{re.escape(suffix)}\.?$")
+    for suffix in (
+        "pty ltd",
+        "pty. ltd.",
+        "pty. ltd",
+        "pty ltd.",
+        "limited",
+        "ltd",
+        "inc",
+        "llc",
+        "corp",
+        "co",
+    )
+)
+_NAME_SPECIAL_CHARS_RE = re.compile(r"[^\w\s]")
+
+
+# Domains repeat heavily across a scrape (ads, maps and organic listings for the
+# same business), so normalization results are memoized
+@functools.lru_cache(maxsize=8192)
 def normalize_domain(url: str) -> Optional[str]:
     """
     Extract and normalize domain from URL.
@@ -97,23 +123,11 @@ def normalize_name(name: str) -> str:
     normalized = name.lower()
 
     # Remove common suffixes
-    suffixes = [
-        "pty ltd",
-        "pty. ltd.",
-        "pty. ltd",
-        "pty ltd.",
-        "limited",
-        "ltd",
-        "inc",
-        "llc",
-        "corp",
-        "co",
-    ]
-    for suffix in suffixes:
-        normalized = re.sub(rf"\s+{re.escape(suffix)}\.?$", "", normalized)
+    for suffix_re in _NAME_SUFFIX_RES:
+        normalized = suffix_re.sub("", normalized)
 
     # Remove special characters except spaces
-    normalized = re.sub(r"[^\w\s]", "", normalized)
+    normalized = _NAME_SPECIAL_CHARS_RE.sub("", normalized)
 
     # Normalize whitespace
     normalized = " ".join(normalized.split())
@@ -141,17 +155,19 @@ def is_directory_url(url: str, domain: str) -> bool:
     domain_lower = domain.lower()
 
     # Check domain against blocklist using proper domain matching
-    # Must be exact match OR end with .directory_domain (for subdomains)
-    for dir_domain in DIRECTORY_DOMAINS:
-        if domain_lower == dir_domain:
-            return True
-        if domain_lower.endswith('.' + dir_domain):
+    # Must be exact match OR end with .directory_domain (for subdomains),
+    # so look up the domain and each parent suffix in the set
+    if domain_lower in DIRECTORY_DOMAINS:
+        return True
+    dot = domain_lower.find('.')
+    while dot != -1:
+        if domain_lower[dot + 1:] in DIRECTORY_DOMAINS:
             return True
+        dot = domain_lower.find('.', dot + 1)
 
     # Check URL patterns (e.g., /r/ for Reddit, even if domain isn't blocked)
     if url:
-        url_lower = url.lower()
-        if any(pattern in url_lower for pattern in DIRECTORY_URL_PATTERNS):
+        if _DIRECTORY_URL_RE.search(url.lower()):
             return True
 
     return False
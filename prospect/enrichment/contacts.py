@@ -7,6 +7,39 @@ from .. import _native
 from ..config import PHONE_PATTERNS, EMAIL_PATTERN, SPAM_EMAIL_PATTERNS, SPAM_EMAIL_DOMAINS
 
 
+# All spam patterns as one alternation, tried once per address with match()
+_SPAM_EMAIL_RE = re.compile("|".join(f"(?:{p})" for p in SPAM_EMAIL_PATTERNS))
+
+# Common false positives to filter (in addition to spam patterns), compiled
+# into one alternation so each candidate email is checked in a single search
+_EXCLUDE_EMAIL_RE = re.compile("|".join([
+    r"@example\.",
+    r"@test\.",
+    r"@localhost",
+    r"@domain\.",
+    r"@email\.",
+    r"@your",
+    r"@site",
+    r"@sample\.",
+    r"@placeholder\.",
+    r"cloudflare",
+    r"googleapis",
+    r"jquery",
+    r"bootstrap",
+    r"fontawesome",
+    r"\.png$",
+    r"\.jpg$",
+    r"\.gif$",
+    r"\.css$",
+    r"\.js$",
+    r"\.svg$",
+    r"\.woff",
+    r"\.webp$",
+    r"@2x\.",  # Retina image naming convention
+    r"@3x\.",  # Retina image naming convention
+]))
+
+
 def is_spam_email(email: str) -> bool:
     """
     Check if email is likely spam/system email.
@@ -17,20 +50,18 @@ def is_spam_email(email: str) -> bool:
     Returns:
         True if email appears to be spam/system/tracking email
     """
-    email_lower = email.lower()
+    return _is_spam_lowered(email.lower())
 
+
+def _is_spam_lowered(email_lower: str) -> bool:
+    """is_spam_email for an address that is already lowercased."""
     # Check domain blocklist
-    if "@" in email_lower:
-        domain = email_lower.split("@")[-1]
-        if domain in SPAM_EMAIL_DOMAINS:
-            return True
+    _, at, domain = email_lower.rpartition("@")
+    if at and domain in SPAM_EMAIL_DOMAINS:
+        return True
 
     # Check patterns
-    for pattern in SPAM_EMAIL_PATTERNS:
-        if re.match(pattern, email_lower):
-            return True
-
-    return False
+    return _SPAM_EMAIL_RE.match(email_lower) is not None
 
 
 def extract_emails(html: str) -> List[str]:
@@ -56,34 +87,6 @@ def extract_emails(html: str) -> List[str]:
     valid_emails = []
     seen = set()
 
-    # Common false positives to filter (in addition to spam patterns)
-    exclude_patterns = [
-        r"@example\.",
-        r"@test\.",
-        r"@localhost",
-        r"@domain\.",
-        r"@email\.",
-        r"@your",
-        r"@site",
-        r"@sample\.",
-        r"@placeholder\.",
-        r"cloudflare",
-        r"googleapis",
-        r"jquery",
-        r"bootstrap",
-        r"fontawesome",
-        r"\.png$",
-        r"\.jpg$",
-        r"\.gif$",
-        r"\.css$",
-        r"\.js$",
-        r"\.svg$",
-        r"\.woff",
-        r"\.webp$",
-        r"@2x\.",  # Retina image naming convention
-        r"@3x\.",  # Retina image naming convention
-    ]
-
     for email in emails:
         email_lower = email.lower()
 
@@ -91,12 +94,8 @@ def extract_emails(html: str) -> List[str]:
         if email_lower in seen:
             continue
 
-        # Skip spam/system emails
-        if is_spam_email(email_lower):
-            continue
-
-        # Skip if matches exclude patterns
-        if any(re.search(pattern, email_lower) for pattern in exclude_patterns):
+        # Skip spam/system emails and common false positives
+        if _is_spam_lowered(email_lower) or _EXCLUDE_EMAIL_RE.search(email_lower):
             continue
 
         # Skip very long emails (probably not real)
@@ -136,10 +136,9 @@ class WebsiteCrawler:
         else:
             valid_emails = signals.emails
 
-        # Merge validated contact info
-        for email in valid_emails:
-            if email not in prospect.emails:
-                prospect.emails.append(email)
+        # Merge validated contact info (unique, order preserved)
+        if valid_emails:
+            prospect.emails = list(dict.fromkeys((prospect.emails or []) + valid_emails))
 
         if signals.phones and not prospect.phone:
             prospect.phone = signals.phones[0]
@@ -1,10 +1,54 @@
 """Technology detection (CMS, tracking, booking systems)."""
 
+import functools
 from typing import Optional, Dict
 
 from .. import _native
 from ..config import CMS_SIGNATURES, TRACKING_SIGNATURES, BOOKING_SIGNATURES
 
+# Signatures lowercased once at import so the pure-Python fallbacks below only
+# scan the page, rather than re-lowercasing every signature on every call
+_CMS_SIGNATURES = tuple(
+    (cms_name, tuple(sig.lower() for sig in signatures))
+    for cms_name, signatures in CMS_SIGNATURES.items()
+)
+_TRACKING_SIGNATURES = tuple(
+    (tracker, tuple(sig.lower() for sig in signatures))
+    for tracker, signatures in TRACKING_SIGNATURES.items()
+)
+_BOOKING_SIGNATURES = tuple(sig.lower() for sig in BOOKING_SIGNATURES)
+
+_FRAMEWORK_SIGNATURES = (
+    ("React", ("react", "reactdom", "__react")),
+    ("Vue.js", ("vue.js", "vuejs", "__vue__")),
+    ("Angular", ("ng-app", "ng-controller", "angular")),
+    ("jQuery", ("jquery", "$(document)", "$.ajax")),
+    ("Bootstrap", ("bootstrap.min", "bootstrap.css")),
+    ("Tailwind", ("tailwindcss", "tailwind.css")),
+)
+
+_RESPONSIVE_INDICATORS = (
+    'viewport',
+    'media=',
+    '@media',
+    'responsive',
+    'mobile',
+    'bootstrap',
+    'tailwind',
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _lowered(html: str) -> str:
+    """
+    Lowercase a page, remembering the last one.
+
+    The crawler runs several detectors over the same page in a row; caching
+    the most recent result means the page is lowercased once, not per
+    detector (str caches its own hash, so repeat lookups are cheap).
+    """
+    return html.lower()
+
 
 def detect_cms(html: str) -> Optional[str]:
     """
@@ -22,11 +66,11 @@ def detect_cms(html: str) -> Optional[str]:
     if not html:
         return None
 
-    html_lower = html.lower()
+    html_lower = _lowered(html)
 
-    for cms_name, signatures in CMS_SIGNATURES.items():
+    for cms_name, signatures in _CMS_SIGNATURES:
         for signature in signatures:
-            if signature.lower() in html_lower:
+            if signature in html_lower:
                 return cms_name
 
     return None
@@ -54,11 +98,11 @@ def detect_tracking(html: str) -> Dict[str, bool]:
     if not html:
         return result
 
-    html_lower = html.lower()
+    html_lower = _lowered(html)
 
-    for tracker, signatures in TRACKING_SIGNATURES.items():
+    for tracker, signatures in _TRACKING_SIGNATURES:
         for signature in signatures:
-            if signature.lower() in html_lower:
+            if signature in html_lower:
                 result[tracker] = True
                 break
 
@@ -81,10 +125,10 @@ def detect_booking_system(html: str) -> bool:
     if not html:
         return False
 
-    html_lower = html.lower()
+    html_lower = _lowered(html)
 
-    for signature in BOOKING_SIGNATURES:
-        if signature.lower() in html_lower:
+    for signature in _BOOKING_SIGNATURES:
+        if signature in html_lower:
             return True
 
     return False
@@ -130,18 +174,9 @@ def detect_frameworks(html: str) -> list[str]:
     if not html:
         return frameworks
 
-    html_lower = html.lower()
-
-    framework_signatures = {
-        "React": ["react", "reactdom", "__react"],
-        "Vue.js": ["vue.js", "vuejs", "__vue__"],
-        "Angular": ["ng-app", "ng-controller", "angular"],
-        "jQuery": ["jquery", "$(document)", "$.ajax"],
-        "Bootstrap": ["bootstrap.min", "bootstrap.css"],
-        "Tailwind": ["tailwindcss", "tailwind.css"],
-    }
+    html_lower = _lowered(html)
 
-    for framework, signatures in framework_signatures.items():
+    for framework, signatures in _FRAMEWORK_SIGNATURES:
         for signature in signatures:
             if signature in html_lower:
                 frameworks.append(framework)
@@ -166,19 +201,9 @@ def detect_responsive(html: str) -> bool:
     if not html:
         return False
 
-    html_lower = html.lower()
-
-    responsive_indicators = [
-        'viewport',
-        'media=',
-        '@media',
-        'responsive',
-        'mobile',
-        'bootstrap',
-        'tailwind',
-    ]
+    html_lower = _lowered(html)
 
-    return any(indicator in html_lower for indicator in responsive_indicators)
+    return any(indicator in html_lower for indicator in _RESPONSIVE_INDICATORS)
 
 
 def get_cms_quality_tier(cms: Optional[str]) -> str:
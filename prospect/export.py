@@ -237,7 +237,7 @@ def prospect_to_dict(prospect: Prospect) -> dict:
         "domain": prospect.domain,
         "phone": prospect.phone,
         "address": prospect.address,
-        "emails": prospect.emails,
+        "emails": prospect.emails or [],
         "serp_presence": {
             "ads": {
                 "found": prospect.found_in_ads,
@@ -5,7 +5,7 @@ from typing import Optional
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class AdResult:
     """Represents a Google Ads result from SERP."""
 
@@ -17,7 +17,7 @@ class AdResult:
     is_top: bool  # True if ad is above organic results
 
 
-@dataclass
+@dataclass(slots=True)
 class MapsResult:
     """Represents a Google Maps/Local Pack result from SERP."""
 
@@ -31,7 +31,7 @@ class MapsResult:
     website: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OrganicResult:
     """Represents an organic search result from SERP."""
 
@@ -42,7 +42,7 @@ class OrganicResult:
     snippet: str
 
 
-@dataclass
+@dataclass(slots=True)
 class SerpResults:
     """Container for all SERP results from a single search."""
 
@@ -54,7 +54,7 @@ class SerpResults:
     organic: list[OrganicResult] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class WebsiteSignals:
     """
     Marketing signals extracted from a website.
@@ -81,7 +81,16 @@ class WebsiteSignals:
     social_links: list[str] = field(default_factory=list)
 
 
-@dataclass
+def _best_position(current: Optional[int], other: Optional[int]) -> Optional[int]:
+    """Return the better (lower) of two SERP positions, ignoring missing ones."""
+    if other is None:
+        return current
+    if current is None:
+        return other
+    return min(current, other)
+
+
+@dataclass(slots=True)
 class Prospect:
     """A potential prospect/lead with all gathered data."""
 
@@ -104,8 +113,8 @@ class Prospect:
     review_count: Optional[int] = None
     category: Optional[str] = None
 
-    # Contact info
-    emails: list[str] = field(default_factory=list)
+    # Contact info (None until some are found; most prospects never get any)
+    emails: Optional[list[str]] = None
 
     # Website signals
     signals: Optional[WebsiteSignals] = None
@@ -124,37 +133,29 @@ class Prospect:
         """Merge data from another prospect record (for deduplication)."""
         # Keep existing values, fill in missing ones
         if not self.website and other.website:
+            # Domain travels with the website it was derived from
             self.website = other.website
             self.domain = other.domain
-        if not self.phone and other.phone:
-            self.phone = other.phone
-        if not self.address and other.address:
-            self.address = other.address
-        if not self.rating and other.rating:
+        self.phone = self.phone or other.phone
+        self.address = self.address or other.address
+        # A real 0 rating / review count is data, so only fill absent numbers
+        if self.rating is None:
             self.rating = other.rating
-        if not self.review_count and other.review_count:
+        if self.review_count is None:
             self.review_count = other.review_count
-        if not self.category and other.category:
-            self.category = other.category
-
-        # Merge SERP presence
-        if other.found_in_ads:
-            self.found_in_ads = True
-            if not self.ad_position or other.ad_position < self.ad_position:
-                self.ad_position = other.ad_position
-        if other.found_in_maps:
-            self.found_in_maps = True
-            if not self.maps_position or other.maps_position < self.maps_position:
-                self.maps_position = other.maps_position
-        if other.found_in_organic:
-            self.found_in_organic = True
-            if not self.organic_position or other.organic_position < self.organic_position:
-                self.organic_position = other.organic_position
-
-        # Merge emails (unique)
-        for email in other.emails:
-            if email not in self.emails:
-                self.emails.append(email)
+        self.category = self.category or other.category
+
+        # Merge SERP presence, keeping the best (lowest) known position
+        self.found_in_ads = self.found_in_ads or other.found_in_ads
+        self.ad_position = _best_position(self.ad_position, other.ad_position)
+        self.found_in_maps = self.found_in_maps or other.found_in_maps
+        self.maps_position = _best_position(self.maps_position, other.maps_position)
+        self.found_in_organic = self.found_in_organic or other.found_in_organic
+        self.organic_position = _best_position(self.organic_position, other.organic_position)
+
+        # Merge emails (unique, order preserved)
+        if other.emails:
+            self.emails = list(dict.fromkeys((self.emails or []) + other.emails))
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -196,7 +197,7 @@ class Prospect:
         return data
 
 
-@dataclass
+@dataclass(slots=True)
 class CrawlResult:
     """Result from crawling a website."""
 
@@ -62,7 +62,7 @@ def calculate_fit_score(
         score += config.organic_top10_weight
 
     # Cap at 100
-    return min(score, 100)
+    return score if score < 100 else 100
 
 
 def get_fit_breakdown(prospect: Prospect) -> dict:
@@ -1,5 +1,6 @@
 """Generate plain-English opportunity notes for prospects."""
 
+from ..config import WEAK_CMS
 from ..models import Prospect, WebsiteSignals
 
 
@@ -57,25 +58,23 @@ def generate_opportunity_notes(prospect: Prospect) -> str:
         conversion_opportunities.append("phone not easily found")
 
     # Technical opportunities
-    weak_cms = ["Wix", "Weebly", "GoDaddy Website Builder"]
-    if signals.cms and signals.cms in weak_cms:
+    if signals.cms in WEAK_CMS:
         technical_opportunities.append(f"using {signals.cms} (limited platform)")
 
     if signals.load_time_ms and signals.load_time_ms > 3000:
         technical_opportunities.append(f"slow site ({signals.load_time_ms}ms load time)")
 
     # Build notes string
-    if seo_opportunities:
-        notes.append("SEO: " + ", ".join(seo_opportunities))
-
-    if tracking_opportunities:
-        notes.append("Tracking: " + ", ".join(tracking_opportunities))
-
-    if conversion_opportunities:
-        notes.append("Conversion: " + ", ".join(conversion_opportunities))
-
-    if technical_opportunities:
-        notes.append("Technical: " + ", ".join(technical_opportunities))
+    notes.extend(
+        f"{label}: {', '.join(items)}"
+        for label, items in (
+            ("SEO", seo_opportunities),
+            ("Tracking", tracking_opportunities),
+            ("Conversion", conversion_opportunities),
+            ("Technical", technical_opportunities),
+        )
+        if items
+    )
 
     # Add positive signals as context
     strengths = []
@@ -125,7 +124,7 @@ def generate_outreach_angle(prospect: Prospect) -> str:
     if prospect.found_in_maps and prospect.maps_position and prospect.maps_position > 1:
         return f"Help them reach #1 in local search (currently #{prospect.maps_position})"
 
-    if signals.cms in ["Wix", "Weebly", "GoDaddy Website Builder"]:
+    if signals.cms in WEAK_CMS:
         return "Upgrade their website platform for better performance and SEO"
 
     if signals.load_time_ms and signals.load_time_ms > 3000:
@@ -179,8 +178,7 @@ def get_priority_services(prospect: Prospect) -> list[str]:
         services.append("Booking System")
 
     # Website improvements
-    weak_cms = ["Wix", "Weebly", "GoDaddy Website Builder"]
-    if signals.cms and signals.cms in weak_cms:
+    if signals.cms in WEAK_CMS:
         services.append("Website Redesign")
     elif signals.load_time_ms and signals.load_time_ms > 3000:
         services.append("Website Optimization")
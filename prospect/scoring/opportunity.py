@@ -2,7 +2,7 @@
 
 from typing import Optional
 from .. import _native
-from ..config import ScoringConfig
+from ..config import ScoringConfig, WEAK_CMS
 from ..models import Prospect, WebsiteSignals
 
 
@@ -55,8 +55,7 @@ def calculate_opportunity_score(
         score += config.no_contact_weight
 
     # Using a "weak" CMS (10 points)
-    weak_cms = ["Wix", "Weebly", "GoDaddy Website Builder"]
-    if signals.cms and signals.cms in weak_cms:
+    if signals.cms in WEAK_CMS:
         score += config.weak_cms_weight
 
     # Slow site (10 points) - over 3 seconds
@@ -86,7 +85,7 @@ def calculate_opportunity_score(
         score += config.poor_organic_ranking_weight
 
     # Clamp to 0-100
-    return max(0, min(score, 100))
+    return 0 if score < 0 else 100 if score > 100 else score
 
 
 def get_opportunity_breakdown(prospect: Prospect) -> dict:
@@ -158,8 +157,7 @@ def get_opportunity_breakdown(prospect: Prospect) -> dict:
         })
         breakdown["total"] += config.no_contact_weight
 
-    weak_cms = ["Wix", "Weebly", "GoDaddy Website Builder"]
-    if signals.cms and signals.cms in weak_cms:
+    if signals.cms in WEAK_CMS:
         breakdown["opportunities"].append({
             "factor": f"Using {signals.cms}",
             "points": config.weak_cms_weight,
@@ -1,5 +1,6 @@
 """Location expansion for deeper searches."""
 
+import functools
 import math
 from dataclasses import dataclass
 from typing import List, Dict, Optional
@@ -7,7 +8,7 @@ from typing import List, Dict, Optional
 from prospect import _native
 
 
-@dataclass
+@dataclass(slots=True)
 class Location:
     """Location with coordinates."""
     name: str
@@ -194,6 +195,13 @@ def get_nearby_suburbs(
     Returns:
         List of suburb names for search queries
     """
+    # The suburb tables are static, so repeat lookups reuse the cached answer
+    return list(_find_nearby_suburbs(location, radius_km, max_results))
+
+
+@functools.lru_cache(maxsize=4096)
+def _find_nearby_suburbs(location: str, radius_km: float, max_results: int) -> tuple:
+    """Cached body of get_nearby_suburbs (a tuple, so callers can't mutate it)."""
     location_lower = location.lower().strip()
 
     # Find the base city
@@ -225,7 +233,7 @@ def get_nearby_suburbs(
 
     if not base_city or not base_location:
         # Unknown location, return original
-        return [location]
+        return (location,)
 
     # Calculate distances and filter
     suburbs = AUSTRALIAN_LOCATIONS[base_city]
@@ -255,9 +263,7 @@ def get_nearby_suburbs(
 
     # Sort by distance and limit
     nearby.sort(key=lambda x: x[1])
-    result = [base_location.name] + [s[0] for s in nearby[:max_results - 1]]
-
-    return result
+    return (base_location.name, *(s[0] for s in nearby[:max_results - 1]))
 
 
 def expand_query_variations(
@@ -284,6 +290,21 @@ def expand_query_variations(
     return variations
 
 
+def _build_coordinates_index() -> Dict[str, tuple]:
+    """Map lowercased city and suburb names to coordinates (first match wins)."""
+    index: Dict[str, tuple] = {}
+    for city, suburbs in AUSTRALIAN_LOCATIONS.items():
+        # A city name resolves to its first listed location (the CBD)
+        index.setdefault(suburbs[0].name.lower(), (suburbs[0].lat, suburbs[0].lng))
+        index.setdefault(city, (suburbs[0].lat, suburbs[0].lng))
+        for suburb in suburbs[1:]:
+            index.setdefault(suburb.name.lower(), (suburb.lat, suburb.lng))
+    return index
+
+
+_COORDINATES_BY_NAME = _build_coordinates_index()
+
+
 def get_location_coordinates(location: str) -> Optional[tuple]:
     """
     Get coordinates for a location name.
@@ -291,14 +312,7 @@ def get_location_coordinates(location: str) -> Optional[tuple]:
     Returns:
         Tuple of (lat, lng) or None if not found
     """
-    location_lower = location.lower().strip()
-
-    for city, suburbs in AUSTRALIAN_LOCATIONS.items():
-        for suburb in suburbs:
-            if suburb.name.lower() == location_lower or city == location_lower:
-                return (suburb.lat, suburb.lng)
-
-    return None
+    return _COORDINATES_BY_NAME.get(location.lower().strip())
 
 
 # Mapping of city names to SerpAPI-compatible coordinates
@@ -315,6 +329,7 @@ CITY_COORDINATES = {
 }
 
 
+@functools.lru_cache(maxsize=1024)
 def location_to_coords(location: str) -> str:
     """Convert location name to lat/lng string for SerpAPI Maps."""
     location_lower = location.lower()
@@ -15,7 +15,7 @@ from prospect import _native
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchPlan:
     """Plan for a search with all queries and locations."""
     queries: List[str]
@@ -41,7 +41,7 @@ class SearchPlan:
         return min(calls, self.max_api_calls)
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchProgress:
     """Real-time search progress."""
     phase: str  # planning, searching, deduplicating, enriching, scoring, complete
@@ -73,11 +73,14 @@ class SearchOrchestrator:
         self,
         serpapi_key: Optional[str] = None,
         cache_ttl_hours: int = 24,
+        client: Optional[SerpAPIClient] = None,
     ):
         self.serpapi_key = serpapi_key
         self.cache_ttl = timedelta(hours=cache_ttl_hours)
         self._cache: Dict[str, Dict] = {}
-        self._client: Optional[SerpAPIClient] = None
+        self._client: Optional[SerpAPIClient] = client
+        # A client passed in is shared with the caller, so close() leaves it open
+        self._owns_client = client is None
 
     def _get_client(self) -> SerpAPIClient:
         """Get or create SerpAPI client."""
@@ -160,6 +163,8 @@ class SearchOrchestrator:
         # Track all results
         all_serp_results: List[SerpResults] = []
         all_maps_results: List[MapsResult] = []
+        # Running count of SERP listings, so progress doesn't re-walk every page
+        serp_result_count = 0
         api_calls_made = 0
 
         progress.phase = "searching"
@@ -179,12 +184,14 @@ class SearchOrchestrator:
                 cached = self._get_cached(cache_key)
 
                 if cached:
-                    all_serp_results.extend(cached.get("serp", []))
+                    cached_serp_results = cached.get("serp", [])
+                    all_serp_results.extend(cached_serp_results)
                     all_maps_results.extend(cached.get("maps", []))
-                    progress.total_prospects = sum(
+                    serp_result_count += sum(
                         len(sr.ads) + len(sr.maps) + len(sr.organic)
-                        for sr in all_serp_results
-                    ) + len(all_maps_results)
+                        for sr in cached_serp_results
+                    )
+                    progress.total_prospects = serp_result_count + len(all_maps_results)
                     yield progress
                     continue
 
@@ -208,12 +215,12 @@ class SearchOrchestrator:
                             )
                             all_serp_results.append(results)
                             cached_serp.append(results)
+                            serp_result_count += (
+                                len(results.ads) + len(results.maps) + len(results.organic)
+                            )
                             api_calls_made += 1
                             progress.completed_api_calls = api_calls_made
-                            progress.total_prospects = sum(
-                                len(sr.ads) + len(sr.maps) + len(sr.organic)
-                                for sr in all_serp_results
-                            ) + len(all_maps_results)
+                            progress.total_prospects = serp_result_count + len(all_maps_results)
                             yield progress
 
                         except Exception as e:
@@ -239,10 +246,7 @@ class SearchOrchestrator:
                             cached_maps.extend(maps_results)
                             api_calls_made += 1
                             progress.completed_api_calls = api_calls_made
-                            progress.total_prospects = sum(
-                                len(sr.ads) + len(sr.maps) + len(sr.organic)
-                                for sr in all_serp_results
-                            ) + len(all_maps_results)
+                            progress.total_prospects = serp_result_count + len(all_maps_results)
                             yield progress
 
                         except Exception as e:
@@ -270,10 +274,7 @@ class SearchOrchestrator:
                                 ))
                             api_calls_made += 1
                             progress.completed_api_calls = api_calls_made
-                            progress.total_prospects = sum(
-                                len(sr.ads) + len(sr.maps) + len(sr.organic)
-                                for sr in all_serp_results
-                            ) + len(all_maps_results)
+                            progress.total_prospects = serp_result_count + len(all_maps_results)
                             yield progress
 
                         except Exception as e:
@@ -360,9 +361,9 @@ class SearchOrchestrator:
 
     def close(self):
         """Close resources."""
-        if self._client:
+        if self._client and self._owns_client:
             self._client.close()
-            self._client = None
+        self._client = None
 
     def __enter__(self):
         return self
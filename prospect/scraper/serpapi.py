@@ -11,7 +11,6 @@ import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from ..models import SerpResults, AdResult, MapsResult, OrganicResult
-from ..config import DIRECTORY_DOMAINS
 
 logger = logging.getLogger(__name__)
 
@@ -286,7 +285,7 @@ class SerpAPIClient:
 
     def _parse_organic(self, organic_data: list) -> list[OrganicResult]:
         """Parse organic results from SerpAPI response."""
-        from ..dedup import normalize_domain
+        from ..dedup import is_directory_domain, normalize_domain
         results = []
 
         for item in organic_data:
@@ -299,8 +298,9 @@ class SerpAPIClient:
                     logger.debug("Could not normalize domain from: %s", url)
                     continue
 
-                # Skip directories
-                if any(d in domain for d in DIRECTORY_DOMAINS):
+                # Skip directories (exact or subdomain match, so "plumbing.com.au"
+                # isn't mistaken for "bing.com")
+                if is_directory_domain(domain):
                     continue
 
                 results.append(OrganicResult(
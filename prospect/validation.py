@@ -1,5 +1,6 @@
 """Data validation utilities for phone, email, and business name cleaning."""
 
+import functools
 import re
 from typing import Optional, Tuple
 
@@ -93,6 +94,12 @@ LOCATION_TO_STATE = {
     "australian capital territory": "ACT",
 }
 
+# Landline prefix -> first state listed for it (e.g. "08" -> "SA"), built once
+# instead of scanning AU_AREA_CODES for every rejected phone
+_STATE_BY_AREA_CODE = {
+    prefix: state for state, (prefix, _) in reversed(AU_AREA_CODES.items())
+}
+
 
 def normalize_phone(phone: str) -> str:
     """
@@ -122,6 +129,9 @@ def normalize_phone(phone: str) -> str:
     return digits
 
 
+# A search has one location but validates a phone per prospect, so the
+# keyword scan only needs to run once per distinct location string
+@functools.lru_cache(maxsize=256)
 def get_state_from_location(location: str) -> Optional[str]:
     """
     Extract state from location string.
@@ -181,13 +191,10 @@ def validate_phone_for_location(phone: str, location: str) -> Tuple[bool, str]:
         return True, f"Valid {state} landline"
 
     # Wrong area code
-    if normalized[:2] in ['02', '03', '07', '08']:
-        actual_prefix = normalized[:2]
-        # Find which state this prefix belongs to
-        for s, (prefix, _) in AU_AREA_CODES.items():
-            if prefix == actual_prefix:
-                return False, f"Area code {actual_prefix} is for {s}, not {state}"
-        return False, f"Wrong area code for {state}"
+    actual_prefix = normalized[:2]
+    actual_state = _STATE_BY_AREA_CODE.get(actual_prefix)
+    if actual_state:
+        return False, f"Area code {actual_prefix} is for {actual_state}, not {state}"
 
     return True, "Unknown format"
 
@@ -251,6 +258,28 @@ def clean_business_name(name: str) -> str:
     return name.strip()
 
 
+# Common email providers, accepted for any website domain
+_GENERIC_EMAIL_PROVIDERS = frozenset({
+    'gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com',
+    'live.com', 'icloud.com', 'me.com', 'aol.com',
+    'mail.com', 'protonmail.com', 'zoho.com',
+    'bigpond.com', 'bigpond.net.au', 'optusnet.com.au',
+    'telstra.com', 'tpg.com.au', 'internode.on.net',
+})
+
+# Second-level labels under a country TLD (e.g. example.com.au)
+_SECOND_LEVEL_LABELS = frozenset({'com', 'net', 'org', 'gov', 'edu'})
+
+
+def _base_domain(parts: list[str]) -> str:
+    """Get the main domain (last 2-3 labels depending on TLD)."""
+    if len(parts) >= 3 and parts[-2] in _SECOND_LEVEL_LABELS:
+        return '.'.join(parts[-3:])
+    elif len(parts) >= 2:
+        return '.'.join(parts[-2:])
+    return '.'.join(parts)
+
+
 def validate_email_domain(email: str, website_domain: str) -> Tuple[bool, str]:
     """
     Check if email domain matches or is related to the website domain.
@@ -293,26 +322,11 @@ def validate_email_domain(email: str, website_domain: str) -> Tuple[bool, str]:
     email_parts = email_domain.split('.')
     website_parts = website_domain.split('.')
 
-    # Get the main domain (last 2-3 parts depending on TLD)
-    def get_base_domain(parts):
-        if len(parts) >= 3 and parts[-2] in ['com', 'net', 'org', 'gov', 'edu']:
-            return '.'.join(parts[-3:])
-        elif len(parts) >= 2:
-            return '.'.join(parts[-2:])
-        return '.'.join(parts)
-
-    if get_base_domain(email_parts) == get_base_domain(website_parts):
+    if _base_domain(email_parts) == _base_domain(website_parts):
         return True, "Same base domain"
 
     # Common email providers are okay but noted as generic
-    generic_providers = [
-        'gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com',
-        'live.com', 'icloud.com', 'me.com', 'aol.com',
-        'mail.com', 'protonmail.com', 'zoho.com',
-        'bigpond.com', 'bigpond.net.au', 'optusnet.com.au',
-        'telstra.com', 'tpg.com.au', 'internode.on.net',
-    ]
-    if email_domain in generic_providers:
+    if email_domain in _GENERIC_EMAIL_PROVIDERS:
         return True, "Generic provider"
 
     # Mismatch - likely cross-contamination
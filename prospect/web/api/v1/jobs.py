@@ -177,8 +177,9 @@ async def get_results(
     elif format == "csv":
         output = io.StringIO()
         if results:
-            # Get all keys from first result
-            first_dict = results[0].to_dict()
+            # Project each result once; the first row also defines the header
+            rows = [r.to_dict() for r in results]
+            first_dict = rows[0]
             # Flatten nested dicts for CSV
             fieldnames = []
             for k, v in first_dict.items():
@@ -192,9 +193,8 @@ async def get_results(
             writer = csv.DictWriter(output, fieldnames=fieldnames, extrasaction='ignore')
             writer.writeheader()
 
-            for r in results:
+            for d in rows:
                 row = {}
-                d = r.to_dict()
                 for k, v in d.items():
                     if isinstance(v, dict):
                         for sk, sv in v.items():
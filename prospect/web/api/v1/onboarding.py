@@ -1,10 +1,11 @@
 """Onboarding API endpoints for first-time user experience."""
 
 from datetime import datetime
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from sqlalchemy.orm import Session
 
 from prospect.web.database import get_db, User
@@ -24,9 +25,18 @@ ONBOARDING_STEPS = {
 
 STEP_NAME_TO_NUMBER = {v: k for k, v in ONBOARDING_STEPS.items()}
 
+# Steps a client can mark complete (not_started/complete are states, not steps)
+_MARKABLE_STEPS = [
+    name for name in ONBOARDING_STEPS.values() if name not in ("not_started", "complete")
+]
+VALID_STEPS = frozenset(_MARKABLE_STEPS)
+_INVALID_STEP_DETAIL = f"Invalid step name. Valid steps: {', '.join(_MARKABLE_STEPS)}"
+
 
 class OnboardingStatus(BaseModel):
     """Current onboarding status for a user."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     completed: bool
     current_step: int
     steps: dict
@@ -34,19 +44,38 @@ class OnboardingStatus(BaseModel):
 
 class OnboardingStepResponse(BaseModel):
     """Response after marking a step complete."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     success: bool
     completed: bool
     current_step: int
     steps: dict
 
 
-def get_steps_dict(current_step: int) -> dict:
-    """Build steps dictionary showing completion status."""
-    return {
-        "welcome_seen": current_step >= 1,
-        "first_search": current_step >= 2,
-        "score_explained": current_step >= 3,
-    }
+# Completion flags for each of the five possible steps, built once
+_STEPS_BY_STEP = {
+    step: MappingProxyType({
+        "welcome_seen": step >= 1,
+        "first_search": step >= 2,
+        "score_explained": step >= 3,
+    })
+    for step in ONBOARDING_STEPS
+}
+
+
+def get_steps_dict(current_step: int) -> Mapping[str, bool]:
+    """Get the (read-only) steps dictionary showing completion status."""
+    # onboarding_step is nullable and unconstrained in the DB, so clamp it
+    return _STEPS_BY_STEP[min(max(current_step or 0, 0), 4)]
+
+
+# Every finished user gets the same (frozen, so safely shared) answer
+_COMPLETED_RESPONSE = OnboardingStepResponse(
+    success=True,
+    completed=True,
+    current_step=4,
+    steps=get_steps_dict(4),
+)
 
 
 @router.get("/status", response_model=OnboardingStatus)
@@ -82,34 +111,41 @@ def mark_step_complete(
     - Updates user.onboarding_step to appropriate number
     - If step 3 (score_explained) completed, sets onboarding_completed=True
     """
-    valid_steps = ["welcome_seen", "first_search", "score_explained"]
-
-    if step_name not in valid_steps:
+    if step_name not in VALID_STEPS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid step name. Valid steps: {', '.join(valid_steps)}",
+            detail=_INVALID_STEP_DETAIL,
         )
 
+    # Finished users can't advance any further - nothing to write
+    if current_user.onboarding_completed and (current_user.onboarding_step or 0) >= 4:
+        return _COMPLETED_RESPONSE
+
     step_number = STEP_NAME_TO_NUMBER[step_name]
+    completed = current_user.onboarding_completed
+    current_step = current_user.onboarding_step or 0
 
     # Only advance if this step is actually next (or later)
     # This prevents going backwards
-    if step_number > current_user.onboarding_step:
-        current_user.onboarding_step = step_number
+    if step_number > current_step:
+        current_step = step_number
 
         # If completing score_explained (step 3), mark onboarding complete
         if step_number == 3:
-            current_user.onboarding_completed = True
-            current_user.onboarding_step = 4  # complete
+            completed = True
+            current_step = 4  # complete
 
+        current_user.onboarding_step = current_step
+        current_user.onboarding_completed = completed
+        # Respond from the values just written; the commit expires the
+        # instance, and reading it back would cost another SELECT
         db.commit()
-        db.refresh(current_user)
 
     return OnboardingStepResponse(
         success=True,
-        completed=current_user.onboarding_completed,
-        current_step=current_user.onboarding_step,
-        steps=get_steps_dict(current_user.onboarding_step),
+        completed=completed,
+        current_step=current_step,
+        steps=get_steps_dict(current_step),
     )
 
 
@@ -127,11 +163,5 @@ def skip_onboarding(
     current_user.onboarding_step = 4
 
     db.commit()
-    db.refresh(current_user)
 
-    return OnboardingStepResponse(
-        success=True,
-        completed=True,
-        current_step=4,
-        steps=get_steps_dict(4),
-    )
+    return _COMPLETED_RESPONSE
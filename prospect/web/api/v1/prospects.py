@@ -4,7 +4,7 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import func, or_, case, and_
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 from datetime import datetime
 
 from prospect.web.database import get_db, Prospect, Search, User
@@ -49,6 +49,12 @@ class ProspectResponse(BaseModel):
     last_seen_at: Optional[datetime]
     seen_count: int
 
+    @field_validator("tags", mode="before")
+    @classmethod
+    def _null_tags_as_empty(cls, value):
+        """Rows saved before tags existed hold NULL."""
+        return value or []
+
 
 class ProspectStats(BaseModel):
     """Prospect statistics."""
@@ -120,35 +126,7 @@ def list_prospects(
 
     prospects = query.offset(skip).limit(limit).all()
 
-    # Convert to response format, handling null tags
-    result = []
-    for p in prospects:
-        result.append(ProspectResponse(
-            id=p.id,
-            search_id=p.search_id,
-            domain=p.domain,
-            name=p.name,
-            website=p.website,
-            phone=p.phone,
-            emails=p.emails,
-            address=p.address,
-            rating=p.rating,
-            review_count=p.review_count,
-            found_in_ads=p.found_in_ads,
-            found_in_maps=p.found_in_maps,
-            found_in_organic=p.found_in_organic,
-            fit_score=p.fit_score,
-            opportunity_score=p.opportunity_score,
-            priority_score=p.priority_score,
-            opportunity_notes=p.opportunity_notes,
-            status=p.status,
-            user_notes=p.user_notes,
-            tags=p.tags or [],
-            first_seen_at=p.first_seen_at,
-            last_seen_at=p.last_seen_at,
-            seen_count=p.seen_count,
-        ))
-    return result
+    return [ProspectResponse.model_validate(p) for p in prospects]
 
 
 @router.get("/stats", response_model=ProspectStats)
@@ -223,31 +201,7 @@ def get_prospect(
     if not prospect:
         raise HTTPException(status_code=404, detail="Prospect not found")
 
-    return ProspectResponse(
-        id=prospect.id,
-        search_id=prospect.search_id,
-        domain=prospect.domain,
-        name=prospect.name,
-        website=prospect.website,
-        phone=prospect.phone,
-        emails=prospect.emails,
-        address=prospect.address,
-        rating=prospect.rating,
-        review_count=prospect.review_count,
-        found_in_ads=prospect.found_in_ads,
-        found_in_maps=prospect.found_in_maps,
-        found_in_organic=prospect.found_in_organic,
-        fit_score=prospect.fit_score,
-        opportunity_score=prospect.opportunity_score,
-        priority_score=prospect.priority_score,
-        opportunity_notes=prospect.opportunity_notes,
-        status=prospect.status,
-        user_notes=prospect.user_notes,
-        tags=prospect.tags or [],
-        first_seen_at=prospect.first_seen_at,
-        last_seen_at=prospect.last_seen_at,
-        seen_count=prospect.seen_count,
-    )
+    return ProspectResponse.model_validate(prospect)
 
 
 @router.patch("/{prospect_id}", response_model=ProspectResponse)
@@ -290,31 +244,7 @@ def update_prospect(
     db.commit()
     db.refresh(prospect)
 
-    return ProspectResponse(
-        id=prospect.id,
-        search_id=prospect.search_id,
-        domain=prospect.domain,
-        name=prospect.name,
-        website=prospect.website,
-        phone=prospect.phone,
-        emails=prospect.emails,
-        address=prospect.address,
-        rating=prospect.rating,
-        review_count=prospect.review_count,
-        found_in_ads=prospect.found_in_ads,
-        found_in_maps=prospect.found_in_maps,
-        found_in_organic=prospect.found_in_organic,
-        fit_score=prospect.fit_score,
-        opportunity_score=prospect.opportunity_score,
-        priority_score=prospect.priority_score,
-        opportunity_notes=prospect.opportunity_notes,
-        status=prospect.status,
-        user_notes=prospect.user_notes,
-        tags=prospect.tags or [],
-        first_seen_at=prospect.first_seen_at,
-        last_seen_at=prospect.last_seen_at,
-        seen_count=prospect.seen_count,
-    )
+    return ProspectResponse.model_validate(prospect)
 
 
 @router.post("/{prospect_id}/skip", response_model=ProspectResponse)
@@ -335,31 +265,7 @@ def skip_prospect(
     db.commit()
     db.refresh(prospect)
 
-    return ProspectResponse(
-        id=prospect.id,
-        search_id=prospect.search_id,
-        domain=prospect.domain,
-        name=prospect.name,
-        website=prospect.website,
-        phone=prospect.phone,
-        emails=prospect.emails,
-        address=prospect.address,
-        rating=prospect.rating,
-        review_count=prospect.review_count,
-        found_in_ads=prospect.found_in_ads,
-        found_in_maps=prospect.found_in_maps,
-        found_in_organic=prospect.found_in_organic,
-        fit_score=prospect.fit_score,
-        opportunity_score=prospect.opportunity_score,
-        priority_score=prospect.priority_score,
-        opportunity_notes=prospect.opportunity_notes,
-        status=prospect.status,
-        user_notes=prospect.user_notes,
-        tags=prospect.tags or [],
-        first_seen_at=prospect.first_seen_at,
-        last_seen_at=prospect.last_seen_at,
-        seen_count=prospect.seen_count,
-    )
+    return ProspectResponse.model_validate(prospect)
 
 
 class BulkUpdateRequest(BaseModel):
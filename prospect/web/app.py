@@ -10,6 +10,7 @@ from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse, PlainTextResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 
+from prospect.web.clients import close_clients
 from prospect.web.database import init_db
 
 logger = logging.getLogger(__name__)
@@ -150,6 +151,11 @@ def create_app(skip_db_init: bool = False) -> FastAPI:
         logger.info(f"Frontend directory: {FRONTEND_DIR}")
         logger.info(f"Templates directory: {TEMPLATES_DIR}")
 
+    @app.on_event("shutdown")
+    async def shutdown_event():
+        """Release shared resources on shutdown."""
+        close_clients()
+
     return app
 
 
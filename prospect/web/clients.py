@@ -0,0 +1,24 @@
+"""Process-wide API clients shared by search jobs."""
+
+import functools
+
+from prospect.scraper.serpapi import SerpAPIClient
+
+
+@functools.lru_cache(maxsize=1)
+def get_serp_client() -> SerpAPIClient:
+    """
+    Get the shared SerpAPI client.
+
+    Jobs reuse its keep-alive connection pool instead of paying a fresh
+    TLS handshake per search. Raises AuthenticationError if no key is
+    configured; failures aren't cached, so a key set later is picked up.
+    """
+    return SerpAPIClient()
+
+
+def close_clients() -> None:
+    """Close the shared clients (on app shutdown)."""
+    if get_serp_client.cache_info().currsize:
+        get_serp_client().close()
+        get_serp_client.cache_clear()
@@ -1,15 +1,20 @@
 """Database models for prospect persistence."""
 
+import functools
 import os
 import logging
 from datetime import datetime
-from typing import Optional, List, Generator
-from sqlalchemy import create_engine, Column, Integer, String, Float, Boolean, DateTime, Text, ForeignKey, JSON
+from typing import Optional, Generator
+from sqlalchemy import create_engine, event, insert, select, Column, Integer, String, Float, Boolean, DateTime, Text, ForeignKey, JSON, Index
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import sessionmaker, relationship, Session, declarative_base
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
 def get_database_url() -> str:
     """
     Get database URL based on environment.
@@ -17,6 +22,8 @@ def get_database_url() -> str:
     Railway: Uses /data volume for persistence (if mounted)
     Fallback: Uses /app/data for Railway without volume
     Local: Uses ./prospects.db in project root
+
+    Resolved once per process; the engine is bound to the first answer anyway.
     """
     # Check for explicit DATABASE_URL first (allows override)
     if os.environ.get("DATABASE_URL"):
@@ -45,6 +52,22 @@ if DATABASE_URL.startswith("sqlite"):
     connect_args["check_same_thread"] = False
 
 engine = create_engine(DATABASE_URL, connect_args=connect_args)
+
+if DATABASE_URL.startswith("sqlite") and ":memory:" not in DATABASE_URL:
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Use WAL so readers don't block behind writers, and cheapen commits."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-64000")  # 64 MB
+        # Serve reads straight from mapped pages; needs a local (non-network) filesystem
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+        cursor.close()
+
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -138,7 +161,7 @@ class SearchConfig(Base):
 
     # Query expansion
     use_query_variations = Column(Boolean, default=False)
-    query_variations = Column(JSON, default=[])  # Additional query templates
+    query_variations = Column(JSON(none_as_null=True), default=list)  # Additional query templates
 
     # Location expansion
     use_location_expansion = Column(Boolean, default=False)
@@ -165,7 +188,7 @@ class Campaign(Base):
     business_type = Column(String(255), nullable=False)
     location = Column(String(255), nullable=False)
     limit = Column(Integer, default=20)
-    filters = Column(JSON, default={})
+    filters = Column(JSON(none_as_null=True), default=dict)
 
     # Metadata
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -217,9 +240,9 @@ class Search(Base):
     actual_cost_cents = Column(Integer, default=0)
 
     # Expansion tracking
-    queries_searched = Column(JSON, default=[])  # All query variations used
-    locations_searched = Column(JSON, default=[])  # All locations searched
-    pages_fetched = Column(JSON, default={})  # {"organic": [1,2,3], "maps": [1]}
+    queries_searched = Column(JSON(none_as_null=True), default=list)  # All query variations used
+    locations_searched = Column(JSON(none_as_null=True), default=list)  # All locations searched
+    pages_fetched = Column(JSON(none_as_null=True), default=dict)  # {"organic": [1,2,3], "maps": [1]}
 
     # Results by source
     results_from_organic = Column(Integer, default=0)
@@ -235,6 +258,10 @@ class Search(Base):
 class Prospect(Base):
     """Individual prospect - persisted across searches for tracking."""
     __tablename__ = "prospects"
+    __table_args__ = (
+        # Prospect lists are fetched per search and filtered/grouped by status
+        Index("ix_prospects_search_status", "search_id", "status"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     search_id = Column(Integer, ForeignKey("searches.id"))
@@ -285,7 +312,7 @@ class Prospect(Base):
     seen_count = Column(Integer, default=1)
 
     # Tags (JSON array)
-    tags = Column(JSON, default=[])
+    tags = Column(JSON(none_as_null=True), default=list)
 
     # Relationships
     search = relationship("Search", back_populates="prospects")
@@ -367,7 +394,7 @@ class MarketingEvent(Base):
     page_url = Column(String(500), nullable=True)
     occurred_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     # 'metadata' is reserved in SQLAlchemy Declarative models.
-    event_metadata = Column("metadata", JSON, default=dict)
+    event_metadata = Column("metadata", JSON(none_as_null=True), default=dict)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     leads = relationship("MarketingLead", back_populates="event")
@@ -390,12 +417,30 @@ class MarketingLead(Base):
     utm_medium = Column(String(255), nullable=True)
     utm_campaign = Column(String(255), nullable=True)
     # 'metadata' is reserved in SQLAlchemy Declarative models.
-    lead_metadata = Column("metadata", JSON, default=dict)
+    lead_metadata = Column("metadata", JSON(none_as_null=True), default=dict)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     event = relationship("MarketingEvent", back_populates="leads")
 
 
+# Bump only together with a real migration step (DDL or seed change that
+# init_db's full path applies); new indexes are picked up by _ensure_indexes
+SCHEMA_VERSION = 1
+
+
+class SchemaVersion(Base):
+    """Schema version init_db last brought this database up to."""
+    __tablename__ = "schema_version"
+
+    version = Column(Integer, primary_key=True)
+
+
+def _insert_or_ignore(db: Session, model):
+    """Dialect INSERT for model that supports on_conflict_do_nothing()."""
+    upsert = sqlite_insert if db.get_bind().dialect.name == "sqlite" else pg_insert
+    return upsert(model)
+
+
 def seed_search_configs(db: Session) -> None:
     """Seed default search configurations."""
     configs = [
@@ -475,12 +520,12 @@ def seed_search_configs(db: Session) -> None:
     ]
 
     try:
-        for config in configs:
-            existing = db.query(SearchConfig).filter(SearchConfig.name == config["name"]).first()
-            if not existing:
-                db.add(SearchConfig(**config))
-                logger.debug(f"Added search config: {config['name']}")
-
+        # One upsert round-trip; names already in the table are left as-is
+        db.execute(
+            _insert_or_ignore(db, SearchConfig)
+            .values(configs)
+            .on_conflict_do_nothing(index_elements=["name"])
+        )
         db.commit()
         logger.info("Search configs seeded successfully")
     except Exception as e:
@@ -489,18 +534,54 @@ def seed_search_configs(db: Session) -> None:
         raise
 
 
+def _schema_is_current() -> bool:
+    """Check whether init_db has already run at the current SCHEMA_VERSION."""
+    try:
+        with engine.connect() as conn:
+            row = conn.execute(
+                select(SchemaVersion.version).where(SchemaVersion.version == SCHEMA_VERSION)
+            ).first()
+    except DBAPIError:
+        # No marker table yet - a fresh or pre-versioning database
+        return False
+    return row is not None
+
+
+def _ensure_indexes() -> None:
+    """Create any missing indexes; create_all skips them on tables that already exist."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+
 def init_db():
     """Initialize database tables and seed data."""
     try:
         logger.info(f"Initializing database at: {DATABASE_URL}")
 
+        # One lookup instead of reflecting every table on each boot/worker
+        if _schema_is_current():
+            # Still check indexes: databases marked before an index was added
+            # (or where creating it failed) would otherwise never get it
+            _ensure_indexes()
+            logger.info(f"Database already at schema version {SCHEMA_VERSION}")
+            return
+
         # Create tables (non-blocking for SQLite)
         Base.metadata.create_all(bind=engine)
+        _ensure_indexes()
         logger.info("Database tables created successfully")
 
-        # Seed search configs in a separate session
+        # Seed search configs in a separate session. The schema marker is only
+        # written once all DDL above has succeeded, and is staged first so
+        # seeding's commit writes both in one transaction
         db = SessionLocal()
         try:
+            db.execute(
+                _insert_or_ignore(db, SchemaVersion)
+                .values(version=SCHEMA_VERSION)
+                .on_conflict_do_nothing()
+            )
             seed_search_configs(db)
             logger.info("Search configs seeded successfully")
         except Exception as e:
@@ -524,16 +605,22 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
-def save_prospects_from_results(db: Session, search_id: int, results: list) -> List[Prospect]:
+def save_prospects_from_results(db: Session, search_id: int, results: list) -> int:
     """
     Save prospect results to database.
 
     Converts search results (Prospect model from models.py) to database Prospect records.
-    Uses bulk_insert_mappings for efficient batch insertion.
+    Rows go in as one executemany INSERT inside a single transaction.
+
+    Returns:
+        Number of prospects saved (rows are not read back)
     """
+    # One timestamp for the whole batch instead of the column default per row
+    now = datetime.utcnow()
     prospect_dicts = []
     for r in results:
         emails = ",".join(r.emails) if r.emails else None
+        signals = r.signals
         prospect_dicts.append({
             "search_id": search_id,
             "domain": r.domain,
@@ -549,18 +636,21 @@ def save_prospects_from_results(db: Session, search_id: int, results: list) -> L
             "found_in_organic": r.found_in_organic,
             "organic_position": r.organic_position,
             "maps_position": r.maps_position,
-            "cms": r.signals.cms if r.signals else None,
-            "has_analytics": r.signals.has_google_analytics if r.signals else False,
-            "has_facebook_pixel": r.signals.has_facebook_pixel if r.signals else False,
-            "has_booking": r.signals.has_booking_system if r.signals else False,
-            "load_time_ms": r.signals.load_time_ms if r.signals else None,
+            "cms": signals.cms if signals else None,
+            "has_analytics": signals.has_google_analytics if signals else False,
+            "has_facebook_pixel": signals.has_facebook_pixel if signals else False,
+            "has_booking": signals.has_booking_system if signals else False,
+            "load_time_ms": signals.load_time_ms if signals else None,
             "fit_score": r.fit_score,
             "opportunity_score": r.opportunity_score,
             "priority_score": r.priority_score,
             "opportunity_notes": r.opportunity_notes,
+            "first_seen_at": now,
+            "last_seen_at": now,
         })
 
-    db.bulk_insert_mappings(Prospect, prospect_dicts)
+    if prospect_dicts:
+        db.execute(insert(Prospect), prospect_dicts)
     db.commit()
 
-    return db.query(Prospect).filter(Prospect.search_id == search_id).all()
+    return len(prospect_dicts)
@@ -1,8 +1,10 @@
 """FastAPI routes for web UI."""
 
 import asyncio
+import heapq
 import logging
 import os
+from operator import attrgetter
 from typing import Optional
 
 from fastapi import APIRouter, Request, Form, BackgroundTasks, HTTPException
@@ -193,10 +195,11 @@ async def run_search_job(job_id: str):
 
     try:
         # Import scraper components
-        from prospect.scraper.serpapi import SerpAPIClient, AuthenticationError
+        from prospect.scraper.serpapi import AuthenticationError
+        from prospect.web.clients import get_serp_client
         from prospect.dedup import deduplicate_serp_results
         from prospect.enrichment.crawler import WebsiteCrawler
-        from prospect.scoring import calculate_fit_score, calculate_opportunity_score, generate_opportunity_notes
+        from prospect.scoring import generate_opportunity_notes, score_prospects
         from prospect.config import ScraperConfig
 
         # Phase 1: Search
@@ -208,9 +211,7 @@ async def run_search_job(job_id: str):
 
         # Use SerpAPI
         try:
-            client = SerpAPIClient()
-            serp_results = client.search(job.business_type, job.location, job.limit)
-            client.close()
+            serp_results = get_serp_client().search(job.business_type, job.location, job.limit)
         except AuthenticationError as e:
             await job_manager.update_job(
                 job_id,
@@ -282,17 +283,14 @@ async def run_search_job(job_id: str):
             progress_message="Scoring prospects..."
         )
 
-        for prospect in prospects:
-            prospect.fit_score = calculate_fit_score(prospect)
-            prospect.opportunity_score = calculate_opportunity_score(prospect)
-            prospect.priority_score = (prospect.fit_score + prospect.opportunity_score) / 2
-            prospect.opportunity_notes = generate_opportunity_notes(prospect)
+        score_prospects(prospects, fit_weight=0.5, opportunity_weight=0.5)
 
-        # Sort by priority score
-        prospects.sort(key=lambda p: p.priority_score, reverse=True)
+        # Top results by priority score, without sorting the whole list
+        prospects = heapq.nlargest(job.limit, prospects, key=attrgetter("priority_score"))
 
-        # Limit results
-        prospects = prospects[:job.limit]
+        # Notes only for the prospects that made the cut
+        for prospect in prospects:
+            prospect.opportunity_notes = generate_opportunity_notes(prospect)
 
         # Phase 4: Complete
         await job_manager.update_job(
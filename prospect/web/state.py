@@ -1,6 +1,7 @@
 """In-memory state management for search jobs."""
 
 import asyncio
+import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -17,7 +18,7 @@ class JobStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchJob:
     """Represents a search job and its state."""
     id: str
@@ -34,6 +35,11 @@ class SearchJob:
     completed_at: Optional[datetime] = None
     config: Optional[dict] = None  # Store search configuration
     duration_ms: Optional[int] = None  # Duration in milliseconds
+    started_ns: int = field(default_factory=time.monotonic_ns)  # Monotonic clock at creation
+
+    def elapsed_ms(self) -> int:
+        """Milliseconds since the job was created, immune to wall-clock changes."""
+        return (time.monotonic_ns() - self.started_ns) // 1_000_000
 
 
 class JobManager:
@@ -121,10 +127,7 @@ class JobManager:
 
             if status == JobStatus.COMPLETE or status == JobStatus.ERROR:
                 job.completed_at = datetime.now()
-                # Calculate duration
-                if job.created_at:
-                    delta = job.completed_at - job.created_at
-                    job.duration_ms = int(delta.total_seconds() * 1000)
+                job.duration_ms = job.elapsed_ms()
 
         return job
 
@@ -148,5 +151,40 @@ class JobManager:
                 del self._jobs[job_id]
 
 
+class ProgressThrottle:
+    """
+    Coalesce per-item progress updates for a job.
+
+    Forwards at most one update per interval to the job manager, plus the
+    final one (progress reaching total), so long loops don't take the
+    manager lock once per item just to move a progress bar.
+    """
+
+    def __init__(self, manager: JobManager, job_id: str, total: int, interval: float = 0.1):
+        self.manager = manager
+        self.job_id = job_id
+        self.total = total
+        self.interval = interval
+        self._last_emit = float("-inf")
+
+    async def tick(
+        self,
+        progress: int,
+        progress_message: str,
+        progress_total: Optional[int] = None,
+    ) -> None:
+        """Record progress, updating the job if the interval has passed."""
+        now = time.monotonic()
+        if progress < self.total and now - self._last_emit < self.interval:
+            return
+        self._last_emit = now
+        await self.manager.update_job(
+            self.job_id,
+            progress=progress,
+            progress_total=progress_total,
+            progress_message=progress_message,
+        )
+
+
 # Global job manager
 job_manager = JobManager()
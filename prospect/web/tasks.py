@@ -1,11 +1,19 @@
 """Background task execution for search jobs."""
 
 import asyncio
+import heapq
 import logging
-from datetime import datetime
-
-from prospect.web.state import job_manager, JobStatus
-from prospect.web.api.v1.models import SearchRequest
+from operator import attrgetter
+
+from prospect.config import ScraperConfig
+from prospect.dedup import deduplicate_serp_results
+from prospect.enrichment.crawler import WebsiteCrawler
+from prospect.scoring import generate_opportunity_notes, score_prospects
+from prospect.scraper.orchestrator import SearchOrchestrator
+from prospect.scraper.serpapi import AuthenticationError
+from prospect.web.clients import get_serp_client
+from prospect.web.state import job_manager, JobStatus, ProgressThrottle, SearchJob
+from prospect.web.api.v1.models import SearchDepth, SearchRequest
 from prospect.web.database import SessionLocal, Search, User, save_prospects_from_results
 from prospect.web.api.v1.usage import increment_enrichment_usage
 
@@ -19,18 +27,6 @@ async def run_search_task(job_id: str, request: SearchRequest):
         return
 
     try:
-        # Import scraper components
-        from prospect.scraper.serpapi import SerpAPIClient, AuthenticationError
-        from prospect.scraper.orchestrator import SearchOrchestrator
-        from prospect.dedup import deduplicate_serp_results
-        from prospect.enrichment.crawler import WebsiteCrawler
-        from prospect.scoring import (
-            calculate_fit_score,
-            calculate_opportunity_score,
-            generate_opportunity_notes,
-        )
-        from prospect.config import ScraperConfig
-
         # Extract config
         filters = request.filters
         scoring = request.scoring
@@ -43,84 +39,29 @@ async def run_search_task(job_id: str, request: SearchRequest):
             progress_message="Searching Google..."
         )
 
-        # Use orchestrator for tiered search if config available
-        if search_config and request.depth.value != "quick":
-            # Use orchestrator for standard/deep/exhaustive
-            try:
-                orchestrator = SearchOrchestrator()
-                prospects = []
-
-                async for progress in orchestrator.execute_search(
-                    business_type=request.business_type,
-                    location=request.location,
-                    config=search_config,
-                ):
-                    # Update job progress
-                    if progress.phase == "searching":
-                        msg = f"Searching: {progress.current_query}"
-                        if progress.current_location != request.location:
-                            msg += f" in {progress.current_location}"
-                        if progress.current_page > 1:
-                            msg += f" (page {progress.current_page})"
-
-                        await job_manager.update_job(
-                            job_id,
-                            progress_message=msg,
-                            progress=progress.completed_api_calls,
-                            progress_total=progress.total_api_calls,
-                        )
-                    elif progress.phase == "deduplicating":
-                        await job_manager.update_job(
-                            job_id,
-                            progress_message=f"Deduplicating {progress.total_prospects} results..."
-                        )
-                    elif progress.phase == "complete":
-                        prospects = progress.results
-
-                orchestrator.close()
-
-            except AuthenticationError as e:
-                await job_manager.update_job(
-                    job_id,
-                    status=JobStatus.ERROR,
-                    error=f"SerpAPI not configured: {e}"
-                )
-                return
-            except Exception as e:
-                logger.exception("Orchestrator search failed")
-                await job_manager.update_job(
-                    job_id,
-                    status=JobStatus.ERROR,
-                    error=f"Search failed: {e}"
-                )
-                return
+        # Orchestrator for standard/deep/exhaustive, one SerpAPI call for quick
+        if search_config and request.depth != SearchDepth.quick:
+            search = _search_tiered
         else:
-            # Use simple SerpAPI for quick search
-            try:
-                client = SerpAPIClient()
-                serp_results = client.search(
-                    request.business_type,
-                    request.location,
-                    request.limit
-                )
-                client.close()
-            except AuthenticationError as e:
-                await job_manager.update_job(
-                    job_id,
-                    status=JobStatus.ERROR,
-                    error=f"SerpAPI not configured: {e}"
-                )
-                return
-            except Exception as e:
-                await job_manager.update_job(
-                    job_id,
-                    status=JobStatus.ERROR,
-                    error=f"Search failed: {e}"
-                )
-                return
+            search = _search_quick
 
-            # Deduplicate (pass location for phone validation)
-            prospects = deduplicate_serp_results(serp_results, location=request.location)
+        try:
+            prospects = await search(job_id, request, search_config)
+        except AuthenticationError as e:
+            await job_manager.update_job(
+                job_id,
+                status=JobStatus.ERROR,
+                error=f"SerpAPI not configured: {e}"
+            )
+            return
+        except Exception as e:
+            logger.exception("Search failed")
+            await job_manager.update_job(
+                job_id,
+                status=JobStatus.ERROR,
+                error=f"Search failed: {e}"
+            )
+            return
 
         # Apply domain exclusions
         if filters.exclude_domains:
@@ -158,24 +99,27 @@ async def run_search_task(job_id: str, request: SearchRequest):
             )
 
             config = ScraperConfig()
+            # Site fetches are independent, so keep several in flight at once
+            semaphore = asyncio.Semaphore(config.max_concurrent_requests)
+            throttle = ProgressThrottle(job_manager, job_id, total=len(prospects))
+            enriched = 0
 
             async with WebsiteCrawler(config) as crawler:
-                for i, prospect in enumerate(prospects):
-                    # Update progress
-                    await job_manager.update_job(
-                        job_id,
-                        progress=i + 1,
-                        progress_message=f"Analysing {prospect.name[:30]}..."
-                    )
+                async def enrich_one(prospect):
+                    nonlocal enriched
+                    async with semaphore:
+                        try:
+                            await crawler.enrich_prospect(prospect)
+                        except Exception as e:
+                            logger.debug("Failed to enrich %s: %s", prospect.name, e)
 
-                    # Enrich
-                    try:
-                        await crawler.enrich_prospect(prospect)
-                    except Exception as e:
-                        logger.debug("Failed to enrich %s: %s", prospect.name, e)
+                    # Update progress
+                    enriched += 1
+                    await throttle.tick(enriched, f"Analysed {prospect.name[:30]}...")
 
-                    # Small delay between requests
-                    await asyncio.sleep(0.05)
+                await asyncio.gather(
+                    *(enrich_one(p) for p in prospects), return_exceptions=True
+                )
 
         # Phase 3: Score
         await job_manager.update_job(
@@ -184,35 +128,34 @@ async def run_search_task(job_id: str, request: SearchRequest):
             progress_message="Scoring prospects..."
         )
 
-        fit_weight = scoring.fit_weight
-        opp_weight = scoring.opportunity_weight
-
-        for prospect in prospects:
-            prospect.fit_score = calculate_fit_score(prospect)
-            prospect.opportunity_score = calculate_opportunity_score(prospect)
-            prospect.priority_score = (
-                prospect.fit_score * fit_weight +
-                prospect.opportunity_score * opp_weight
+        score_prospects(prospects, scoring.fit_weight, scoring.opportunity_weight)
+
+        # Apply score filters in one pass
+        min_fit = filters.min_fit
+        min_opportunity = filters.min_opportunity
+        min_priority = filters.min_priority
+        require_phone = filters.require_phone
+        require_email = filters.require_email
+
+        def keep(p) -> bool:
+            return (
+                (not min_fit or p.fit_score >= min_fit)
+                and (not min_opportunity or p.opportunity_score >= min_opportunity)
+                and (not min_priority or p.priority_score >= min_priority)
+                and (not require_phone or bool(p.phone))
+                and (not require_email or bool(p.emails))
             )
-            prospect.opportunity_notes = generate_opportunity_notes(prospect)
 
-        # Sort by priority score
-        prospects.sort(key=lambda p: p.priority_score, reverse=True)
-
-        # Apply score filters
-        if filters.min_fit:
-            prospects = [p for p in prospects if p.fit_score >= filters.min_fit]
-        if filters.min_opportunity:
-            prospects = [p for p in prospects if p.opportunity_score >= filters.min_opportunity]
-        if filters.min_priority:
-            prospects = [p for p in prospects if p.priority_score >= filters.min_priority]
-        if filters.require_phone:
-            prospects = [p for p in prospects if p.phone]
-        if filters.require_email:
-            prospects = [p for p in prospects if p.emails]
+        # Top results by priority score (same order as a stable sort + slice)
+        prospects = heapq.nlargest(
+            request.limit,
+            (p for p in prospects if keep(p)),
+            key=attrgetter("priority_score"),
+        )
 
-        # Limit results
-        prospects = prospects[:request.limit]
+        # Notes only for the prospects that made the cut
+        for prospect in prospects:
+            prospect.opportunity_notes = generate_opportunity_notes(prospect)
 
         # Phase 4: Save to database
         await job_manager.update_job(
@@ -220,60 +163,8 @@ async def run_search_task(job_id: str, request: SearchRequest):
             progress_message="Saving results..."
         )
 
-        # Get search_id and campaign_id from job config
-        search_id = job.config.get("search_id") if job.config else None
-        campaign_id = job.config.get("campaign_id") if job.config else None
-
-        # Create or update search record
-        db = SessionLocal()
-        try:
-            if search_id:
-                # Update existing search record (from campaign run)
-                search = db.query(Search).filter(Search.id == search_id).first()
-                if search:
-                    search.status = "complete"
-                    search.total_found = len(prospects)
-                    search.avg_fit_score = sum(p.fit_score for p in prospects) / len(prospects) if prospects else 0
-                    search.avg_opportunity_score = sum(p.opportunity_score for p in prospects) / len(prospects) if prospects else 0
-                    if job.created_at:
-                        search.duration_ms = int((datetime.now() - job.created_at).total_seconds() * 1000)
-                    db.commit()
-            else:
-                # Create new search record
-                search = Search(
-                    campaign_id=campaign_id,
-                    business_type=request.business_type,
-                    location=request.location,
-                    query=f"{request.business_type} in {request.location}",
-                    status="complete",
-                    total_found=len(prospects),
-                    avg_fit_score=sum(p.fit_score for p in prospects) / len(prospects) if prospects else 0,
-                    avg_opportunity_score=sum(p.opportunity_score for p in prospects) / len(prospects) if prospects else 0,
-                    duration_ms=int((datetime.now() - job.created_at).total_seconds() * 1000) if job.created_at else None,
-                )
-                db.add(search)
-                db.commit()
-                db.refresh(search)
-                search_id = search.id
-
-            # Save prospects to database
-            if prospects and search_id:
-                save_prospects_from_results(db, search_id, prospects)
-                logger.info(f"Saved {len(prospects)} prospects to database for search {search_id}")
-
-            # Increment enrichment usage if enrichment was performed
-            if not request.skip_enrichment and prospects:
-                user_id = job.config.get("user_id") if job.config else None
-                if user_id:
-                    user = db.query(User).filter(User.id == user_id).first()
-                    if user:
-                        enrichment_count = len(prospects)
-                        increment_enrichment_usage(db, user, enrichment_count)
-                        logger.info(f"Incremented enrichment usage by {enrichment_count} for user {user_id}")
-        except Exception as e:
-            logger.exception(f"Failed to save search results to database: {e}")
-        finally:
-            db.close()
+        # Blocking SQLite work runs off the event loop so other jobs keep moving
+        await asyncio.to_thread(_save_results, job, request, prospects)
 
         # Phase 5: Complete
         await job_manager.update_job(
@@ -290,3 +181,127 @@ async def run_search_task(job_id: str, request: SearchRequest):
             status=JobStatus.ERROR,
             error=str(e),
         )
+
+
+async def _search_quick(job_id: str, request: SearchRequest, search_config) -> list:
+    """Quick search - a single SerpAPI call, deduplicated."""
+    serp_results = get_serp_client().search(
+        request.business_type,
+        request.location,
+        request.limit
+    )
+
+    # Deduplicate (pass location for phone validation)
+    return deduplicate_serp_results(serp_results, location=request.location)
+
+
+async def _search_tiered(job_id: str, request: SearchRequest, search_config: dict) -> list:
+    """Tiered search through the orchestrator, reporting progress on the job."""
+    orchestrator = SearchOrchestrator(client=get_serp_client())
+    prospects = []
+    search_throttle = None
+
+    try:
+        async for progress in orchestrator.execute_search(
+            business_type=request.business_type,
+            location=request.location,
+            config=search_config,
+        ):
+            # Update job progress
+            if progress.phase == "searching":
+                # Throttled; phase changes below always go straight through
+                if search_throttle is None:
+                    search_throttle = ProgressThrottle(
+                        job_manager, job_id, total=progress.total_api_calls
+                    )
+
+                msg = f"Searching: {progress.current_query}"
+                if progress.current_location != request.location:
+                    msg += f" in {progress.current_location}"
+                if progress.current_page > 1:
+                    msg += f" (page {progress.current_page})"
+
+                await search_throttle.tick(
+                    progress.completed_api_calls,
+                    msg,
+                    progress_total=progress.total_api_calls,
+                )
+            elif progress.phase == "deduplicating":
+                await job_manager.update_job(
+                    job_id,
+                    progress_message=f"Deduplicating {progress.total_prospects} results..."
+                )
+            elif progress.phase == "complete":
+                prospects = progress.results
+    finally:
+        orchestrator.close()
+
+    return prospects
+
+
+def _save_results(job: SearchJob, request: SearchRequest, prospects: list) -> None:
+    """Persist the search record, its prospects and enrichment usage (blocking)."""
+    # Get search_id, campaign_id and user_id from job config
+    job_config = job.config or {}
+    search_id = job_config.get("search_id")
+    campaign_id = job_config.get("campaign_id")
+    user_id = job_config.get("user_id")
+    duration_ms = job.elapsed_ms()
+
+    # Summary scores, shared by the update and create branches below
+    count = len(prospects)
+    fit_sum = opportunity_sum = 0
+    for p in prospects:
+        fit_sum += p.fit_score
+        opportunity_sum += p.opportunity_score
+    avg_fit_score = fit_sum / count if count else 0
+    avg_opportunity_score = opportunity_sum / count if count else 0
+
+    # Create or update search record
+    db = SessionLocal()
+    try:
+        if search_id:
+            # Update existing search record (from campaign run)
+            search = db.query(Search).filter(Search.id == search_id).first()
+            if search:
+                search.status = "complete"
+                search.total_found = count
+                search.avg_fit_score = avg_fit_score
+                search.avg_opportunity_score = avg_opportunity_score
+                search.duration_ms = duration_ms
+                db.commit()
+        else:
+            # Create new search record
+            search = Search(
+                campaign_id=campaign_id,
+                business_type=request.business_type,
+                location=request.location,
+                query=f"{request.business_type} in {request.location}",
+                status="complete",
+                total_found=count,
+                avg_fit_score=avg_fit_score,
+                avg_opportunity_score=avg_opportunity_score,
+                duration_ms=duration_ms,
+            )
+            db.add(search)
+            db.commit()
+            db.refresh(search)
+            search_id = search.id
+
+        # Save prospects to database
+        if prospects and search_id:
+            save_prospects_from_results(db, search_id, prospects)
+            logger.info(f"Saved {len(prospects)} prospects to database for search {search_id}")
+
+        # Increment enrichment usage if enrichment was performed
+        if not request.skip_enrichment and prospects:
+            if user_id:
+                user = db.query(User).filter(User.id == user_id).first()
+                if user:
+                    enrichment_count = len(prospects)
+                    increment_enrichment_usage(db, user, enrichment_count)
+                    logger.info(f"Incremented enrichment usage by {enrichment_count} for user {user_id}")
+    except Exception as e:
+        logger.exception(f"Failed to save search results to database: {e}")
+    finally:
+        db.close()
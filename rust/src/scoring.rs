@@ -50,6 +50,63 @@ fn extract_signals(py: Python<'_>, map: &HashMap<String, PyObject>) -> Option<Ha
         .flatten()
 }
 
+// ---------------------------------------------------------------------------
+// Plain-Rust snapshot of the fields the scorers read
+// ---------------------------------------------------------------------------
+
+/// Website signals used by the opportunity score.
+struct SignalsInput {
+    has_google_analytics: Option<bool>,
+    has_facebook_pixel: Option<bool>,
+    has_booking_system: Option<bool>,
+    has_emails: bool,
+    cms: Option<String>,
+    load_time_ms: Option<i64>,
+}
+
+/// Prospect fields used by both scores, extracted once while holding the GIL
+/// so the scoring itself touches no Python objects (and can run in parallel).
+struct ScoringInput {
+    has_website: bool,
+    has_phone: bool,
+    has_emails: bool,
+    found_in_maps: bool,
+    maps_position: Option<i64>,
+    rating: Option<f64>,
+    review_count: Option<i64>,
+    found_in_ads: bool,
+    found_in_organic: bool,
+    organic_position: Option<i64>,
+    signals: Option<SignalsInput>,
+}
+
+impl ScoringInput {
+    fn extract(py: Python<'_>, prospect: &HashMap<String, PyObject>) -> Self {
+        let signals = extract_signals(py, prospect).map(|s| SignalsInput {
+            has_google_analytics: extract_opt_bool(py, &s, "has_google_analytics"),
+            has_facebook_pixel: extract_opt_bool(py, &s, "has_facebook_pixel"),
+            has_booking_system: extract_opt_bool(py, &s, "has_booking_system"),
+            has_emails: extract_list_nonempty(py, &s, "emails"),
+            cms: extract_opt_string(py, &s, "cms"),
+            load_time_ms: extract_opt_i64(py, &s, "load_time_ms"),
+        });
+
+        ScoringInput {
+            has_website: extract_opt_string(py, prospect, "website").is_some(),
+            has_phone: extract_opt_string(py, prospect, "phone").is_some(),
+            has_emails: extract_list_nonempty(py, prospect, "emails"),
+            found_in_maps: extract_bool(py, prospect, "found_in_maps"),
+            maps_position: extract_opt_i64(py, prospect, "maps_position"),
+            rating: extract_opt_f64(py, prospect, "rating"),
+            review_count: extract_opt_i64(py, prospect, "review_count"),
+            found_in_ads: extract_bool(py, prospect, "found_in_ads"),
+            found_in_organic: extract_bool(py, prospect, "found_in_organic"),
+            organic_position: extract_opt_i64(py, prospect, "organic_position"),
+            signals,
+        }
+    }
+}
+
 // ---------------------------------------------------------------------------
 // Fit score  (prospect/scoring/fit.py)
 // ---------------------------------------------------------------------------
@@ -63,36 +120,36 @@ const WEIGHT_REVIEW_COUNT: u32 = 10;
 const WEIGHT_ADS_PRESENCE: u32 = 10;
 const WEIGHT_ORGANIC_TOP10: u32 = 15;
 
-fn fit_score_inner(py: Python<'_>, prospect: &HashMap<String, PyObject>) -> u32 {
+fn fit_score_inner(prospect: &ScoringInput) -> u32 {
     let mut score: u32 = 0;
 
-    if extract_opt_string(py, prospect, "website").is_some() {
+    if prospect.has_website {
         score += WEIGHT_WEBSITE;
     }
-    if extract_opt_string(py, prospect, "phone").is_some() {
+    if prospect.has_phone {
         score += WEIGHT_PHONE;
     }
-    if extract_list_nonempty(py, prospect, "emails") {
+    if prospect.has_emails {
         score += WEIGHT_EMAIL;
     }
-    if extract_bool(py, prospect, "found_in_maps") {
+    if prospect.found_in_maps {
         score += WEIGHT_MAPS_PRESENCE;
     }
-    if let Some(rating) = extract_opt_f64(py, prospect, "rating") {
+    if let Some(rating) = prospect.rating {
         if rating >= 4.0 {
             score += WEIGHT_GOOD_RATING;
         }
     }
-    if let Some(rc) = extract_opt_i64(py, prospect, "review_count") {
+    if let Some(rc) = prospect.review_count {
         if rc >= 10 {
             score += WEIGHT_REVIEW_COUNT;
         }
     }
-    if extract_bool(py, prospect, "found_in_ads") {
+    if prospect.found_in_ads {
         score += WEIGHT_ADS_PRESENCE;
     }
-    if extract_bool(py, prospect, "found_in_organic") {
-        if let Some(pos) = extract_opt_i64(py, prospect, "organic_position") {
+    if prospect.found_in_organic {
+        if let Some(pos) = prospect.organic_position {
             if pos <= 10 {
                 score += WEIGHT_ORGANIC_TOP10;
             }
@@ -104,7 +161,7 @@ fn fit_score_inner(py: Python<'_>, prospect: &HashMap<String, PyObject>) -> u32
 
 #[pyfunction]
 pub fn calculate_fit_score(prospect: HashMap<String, PyObject>) -> u32 {
-    Python::with_gil(|py| fit_score_inner(py, &prospect))
+    Python::with_gil(|py| fit_score_inner(&ScoringInput::extract(py, &prospect)))
 }
 
 // ---------------------------------------------------------------------------
@@ -122,13 +179,13 @@ const OPP_GOOD_TRACKING_PENALTY: i32 = -10;
 const OPP_POOR_MAPS: i32 = 10;
 const OPP_POOR_ORGANIC: i32 = 20;
 
-fn opportunity_score_inner(py: Python<'_>, prospect: &HashMap<String, PyObject>) -> u32 {
+fn opportunity_score_inner(prospect: &ScoringInput) -> u32 {
     // No website → huge opportunity
-    if extract_opt_string(py, prospect, "website").is_none() {
+    if !prospect.has_website {
         return 80;
     }
 
-    let signals = match extract_signals(py, prospect) {
+    let signals = match &prospect.signals {
         Some(s) => s,
         None => return 50, // can't analyse
     };
@@ -136,55 +193,53 @@ fn opportunity_score_inner(py: Python<'_>, prospect: &HashMap<String, PyObject>)
     let mut score: i32 = 0;
 
     // Missing GA (confirmed false) → +15
-    if extract_opt_bool(py, &signals, "has_google_analytics") == Some(false) {
+    if signals.has_google_analytics == Some(false) {
         score += OPP_NO_ANALYTICS;
     }
 
     // Missing FB pixel (confirmed false) → +10
-    if extract_opt_bool(py, &signals, "has_facebook_pixel") == Some(false) {
+    if signals.has_facebook_pixel == Some(false) {
         score += OPP_NO_PIXEL;
     }
 
     // No booking (confirmed false) → +15
-    if extract_opt_bool(py, &signals, "has_booking_system") == Some(false) {
+    if signals.has_booking_system == Some(false) {
         score += OPP_NO_BOOKING;
     }
 
     // No contact emails → +10
-    if !extract_list_nonempty(py, &signals, "emails") {
+    if !signals.has_emails {
         score += OPP_NO_CONTACT;
     }
 
     // Weak CMS → +10
     let weak_cms = ["Wix", "Weebly", "GoDaddy Website Builder"];
-    if let Some(cms) = extract_opt_string(py, &signals, "cms") {
+    if let Some(cms) = &signals.cms {
         if weak_cms.contains(&cms.as_str()) {
             score += OPP_WEAK_CMS;
         }
     }
 
     // Slow site (>3000ms) → +10
-    if let Some(load_time) = extract_opt_i64(py, &signals, "load_time_ms") {
+    if let Some(load_time) = signals.load_time_ms {
         if load_time > 3000 {
             score += OPP_SLOW_SITE;
         }
     }
 
     // Penalty: already running ads
-    if extract_bool(py, prospect, "found_in_ads") {
+    if prospect.found_in_ads {
         score += OPP_RUNNING_ADS_PENALTY;
     }
 
     // Penalty: has both GA AND FB pixel (both confirmed true)
-    if extract_opt_bool(py, &signals, "has_google_analytics") == Some(true)
-        && extract_opt_bool(py, &signals, "has_facebook_pixel") == Some(true)
-    {
+    if signals.has_google_analytics == Some(true) && signals.has_facebook_pixel == Some(true) {
         score += OPP_GOOD_TRACKING_PENALTY;
     }
 
     // Poor Maps ranking (found in maps but position > 1)
-    if extract_bool(py, prospect, "found_in_maps") {
-        if let Some(pos) = extract_opt_i64(py, prospect, "maps_position") {
+    if prospect.found_in_maps {
+        if let Some(pos) = prospect.maps_position {
             if pos > 1 {
                 score += OPP_POOR_MAPS;
             }
@@ -192,9 +247,9 @@ fn opportunity_score_inner(py: Python<'_>, prospect: &HashMap<String, PyObject>)
     }
 
     // Poor or no organic ranking
-    if !extract_bool(py, prospect, "found_in_organic") {
+    if !prospect.found_in_organic {
         score += OPP_POOR_ORGANIC;
-    } else if let Some(pos) = extract_opt_i64(py, prospect, "organic_position") {
+    } else if let Some(pos) = prospect.organic_position {
         if pos > 5 {
             score += OPP_POOR_ORGANIC;
         }
@@ -205,39 +260,33 @@ fn opportunity_score_inner(py: Python<'_>, prospect: &HashMap<String, PyObject>)
 
 #[pyfunction]
 pub fn calculate_opportunity_score(prospect: HashMap<String, PyObject>) -> u32 {
-    Python::with_gil(|py| opportunity_score_inner(py, &prospect))
+    Python::with_gil(|py| opportunity_score_inner(&ScoringInput::extract(py, &prospect)))
 }
 
 // ---------------------------------------------------------------------------
 // Batch scoring with Rayon
 // ---------------------------------------------------------------------------
 
+fn score_one(prospect: &ScoringInput) -> (u32, u32) {
+    (fit_score_inner(prospect), opportunity_score_inner(prospect))
+}
+
 #[pyfunction]
 pub fn score_prospects_batch(prospects: Vec<HashMap<String, PyObject>>) -> Vec<(u32, u32)> {
-    if prospects.len() <= 10 {
-        // Sequential for small batches
-        Python::with_gil(|py| {
-            prospects
-                .iter()
-                .map(|p| (fit_score_inner(py, p), opportunity_score_inner(py, p)))
-                .collect()
-        })
-    } else {
-        // Parallel via Rayon for larger batches
-        Python::with_gil(|py| {
-            let results: Vec<(u32, u32)> = prospects
-                .par_iter()
-                .map(|p| {
-                    Python::with_gil(|py_inner| {
-                        (
-                            fit_score_inner(py_inner, p),
-                            opportunity_score_inner(py_inner, p),
-                        )
-                    })
-                })
-                .collect();
-            let _ = py; // keep outer GIL reference alive
-            results
-        })
-    }
+    Python::with_gil(|py| {
+        // Read everything out of the Python dicts while we hold the GIL
+        let inputs: Vec<ScoringInput> = prospects
+            .iter()
+            .map(|p| ScoringInput::extract(py, p))
+            .collect();
+
+        if inputs.len() <= 10 {
+            // Sequential for small batches
+            inputs.iter().map(score_one).collect()
+        } else {
+            // Parallel via Rayon for larger batches. The GIL is released and
+            // the workers never take it, so they can't block on this thread.
+            py.allow_threads(|| inputs.par_iter().map(score_one).collect())
+        }
+    })
 }
@@ -15,13 +15,20 @@ import sys
 from pathlib import Path
 from datetime import date
 
+VERSION_RE = re.compile(r'__version__\s*=\s*["\']([^"\']+)["\']')
+MAJOR_RE = re.compile(r'"major":\s*\d+')
+MINOR_RE = re.compile(r'"minor":\s*\d+')
+PATCH_RE = re.compile(r'"patch":\s*\d+')
+RELEASE_RE = re.compile(r'"release":\s*"[^"]+"')
+PYPROJECT_VERSION_RE = re.compile(r'version\s*=\s*"[^"]+"')
+
 
 def get_current_version():
     """Read current version from prospect/__init__.py."""
     init_file = Path("prospect/__init__.py")
     content = init_file.read_text()
 
-    match = re.search(r'__version__\s*=\s*["\']([^"\']+)["\']', content)
+    match = VERSION_RE.search(content)
     if match:
         return match.group(1)
     raise ValueError("Could not find __version__ in prospect/__init__.py")
@@ -61,15 +68,17 @@ def bump_version(current, bump_type):
         raise ValueError(f"Unknown bump type: {bump_type}")
 
 
-def update_file(filepath, pattern, replacement):
-    """Update version in a file."""
+def update_file(filepath, substitutions):
+    """Apply (pattern, replacement) substitutions to a file, reading and writing it once."""
     path = Path(filepath)
     if not path.exists():
         print(f"  Skipping {filepath} (not found)")
         return False
 
     content = path.read_text()
-    new_content = re.sub(pattern, replacement, content)
+    new_content = content
+    for pattern, replacement in substitutions:
+        new_content = pattern.sub(replacement, new_content)
 
     if content != new_content:
         path.write_text(new_content)
@@ -97,26 +106,22 @@ def main():
 
     print(f"\nBumping version: {current} -> {new_version}\n")
 
-    # Update prospect/__init__.py
-    update_file(
-        "prospect/__init__.py",
-        r'__version__\s*=\s*["\'][^"\']+["\']',
-        f'__version__ = "{new_version}"',
-    )
-
-    # Update VERSION_INFO in __init__.py
+    # Update __version__ and VERSION_INFO in prospect/__init__.py
     v = parse_version(new_version)
-    update_file("prospect/__init__.py", r'"major":\s*\d+', f'"major": {v["major"]}')
-    update_file("prospect/__init__.py", r'"minor":\s*\d+', f'"minor": {v["minor"]}')
-    update_file("prospect/__init__.py", r'"patch":\s*\d+', f'"patch": {v["patch"]}')
-
     release_type = "beta" if v.get("suffix") == "beta" else "stable"
     update_file(
-        "prospect/__init__.py", r'"release":\s*"[^"]+"', f'"release": "{release_type}"'
+        "prospect/__init__.py",
+        [
+            (VERSION_RE, f'__version__ = "{new_version}"'),
+            (MAJOR_RE, f'"major": {v["major"]}'),
+            (MINOR_RE, f'"minor": {v["minor"]}'),
+            (PATCH_RE, f'"patch": {v["patch"]}'),
+            (RELEASE_RE, f'"release": "{release_type}"'),
+        ],
     )
 
     # Update pyproject.toml
-    update_file("pyproject.toml", r'version\s*=\s*"[^"]+"', f'version = "{new_version}"')
+    update_file("pyproject.toml", [(PYPROJECT_VERSION_RE, f'version = "{new_version}"')])
 
     print(f"\nVersion bumped to {new_version}")
     print(f"\nNext steps:")
@@ -0,0 +1,47 @@
+"""Shared test fixtures."""
+
+import os
+import shutil
+import tempfile
+
+import pytest
+
+# prospect.web.app initialises the database when imported during collection,
+# before any fixture runs; keep that database out of the checkout too
+_IMPORT_DB_DIR = tempfile.mkdtemp(prefix="leadswarm-tests-")
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite:///{os.path.join(_IMPORT_DB_DIR, 'prospects.db')}"
+)
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(_IMPORT_DB_DIR, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def seeded_db(tmp_path_factory):
+    """Create and seed a throwaway database once for every test that needs it."""
+    from sqlalchemy import create_engine, event
+
+    from prospect.web import database
+
+    url = f"sqlite:///{tmp_path_factory.mktemp('db') / 'prospects.db'}"
+    engine = create_engine(url, connect_args={"check_same_thread": False})
+    event.listen(engine, "connect", database._set_sqlite_pragmas)
+    default_engine = database.engine
+
+    # The app module (imported by other tests) may already have built the
+    # default engine, so rebind it rather than relying on the env var alone
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("DATABASE_URL", url)
+        mp.setattr(database, "DATABASE_URL", url)
+        mp.setattr(database, "engine", engine)
+        database.get_database_url.cache_clear()
+        database.SessionLocal.configure(bind=engine)
+        try:
+            database.init_db()
+            yield
+        finally:
+            database.SessionLocal.configure(bind=default_engine)
+            database.get_database_url.cache_clear()
+    engine.dispose()
@@ -151,3 +151,146 @@ class TestIntegrationScenarios:
         assert domain == "mybusiness.com.au"
         assert is_directory_domain(domain) is False
         assert is_directory_url(url, domain) is False
+
+
+class TestProspectMerge:
+    """Test merging duplicate prospect records."""
+
+    def test_fills_missing_fields(self):
+        """Missing contact data should be filled from the other record."""
+        from prospect.models import Prospect
+
+        base = Prospect(name="Acme", phone="0412 345 678")
+        base.merge_from(Prospect(
+            name="Acme",
+            website="https://acme.com.au",
+            domain="acme.com.au",
+            phone="07 1234 5678",
+            rating=4.5,
+        ))
+
+        assert base.website == "https://acme.com.au"
+        assert base.domain == "acme.com.au"
+        assert base.phone == "0412 345 678"  # Existing value kept
+        assert base.rating == 4.5
+
+    def test_keeps_real_zero_numbers(self):
+        """A genuine 0 rating or review count should not be overwritten."""
+        from prospect.models import Prospect
+
+        base = Prospect(name="Acme", rating=0.0, review_count=0)
+        base.merge_from(Prospect(name="Acme", rating=4.5, review_count=12))
+
+        assert base.rating == 0.0
+        assert base.review_count == 0
+
+    def test_keeps_best_position(self):
+        """SERP positions should keep the lowest known value."""
+        from prospect.models import Prospect
+
+        base = Prospect(name="Acme", found_in_ads=True, ad_position=3)
+        base.merge_from(Prospect(
+            name="Acme",
+            found_in_ads=True,
+            ad_position=1,
+            found_in_maps=True,
+            maps_position=2,
+        ))
+
+        assert base.ad_position == 1
+        assert base.found_in_maps is True
+        assert base.maps_position == 2
+
+    def test_missing_other_position_keeps_existing(self):
+        """A record without a position should not clobber a known one."""
+        from prospect.models import Prospect
+
+        base = Prospect(name="Acme", found_in_organic=True, organic_position=4)
+        base.merge_from(Prospect(name="Acme", found_in_organic=True))
+
+        assert base.organic_position == 4
+
+    def test_merges_emails_without_duplicates(self):
+        """Emails should be unioned in first-seen order."""
+        from prospect.models import Prospect
+
+        base = Prospect(name="Acme", emails=["info@acme.com.au", "sales@acme.com.au"])
+        base.merge_from(Prospect(name="Acme", emails=["sales@acme.com.au", "jobs@acme.com.au"]))
+
+        assert base.emails == ["info@acme.com.au", "sales@acme.com.au", "jobs@acme.com.au"]
+
+    def test_merges_emails_into_prospect_without_any(self):
+        """Emails start unset and are created on first merge."""
+        from prospect.models import Prospect
+
+        base = Prospect(name="Acme")
+        assert base.emails is None
+        assert base.to_dict()["emails"] == []
+
+        base.merge_from(Prospect(name="Acme", emails=["info@acme.com.au"]))
+
+        assert base.emails == ["info@acme.com.au"]
+
+
+class TestBatchScoring:
+    """Test scoring many prospects in one pass."""
+
+    def test_matches_individual_scores(self):
+        """Batch scoring should agree with the per-prospect functions."""
+        from prospect.models import Prospect
+        from prospect.scoring import (
+            calculate_fit_score,
+            calculate_opportunity_score,
+            score_prospects,
+        )
+
+        prospects = [
+            Prospect(name="Acme", website="https://acme.com.au", phone="0412 345 678"),
+            Prospect(name="Bare", found_in_maps=True, rating=3.9, review_count=4),
+        ]
+        score_prospects(prospects)
+
+        for prospect in prospects:
+            assert prospect.fit_score == calculate_fit_score(prospect)
+            assert prospect.opportunity_score == calculate_opportunity_score(prospect)
+
+    def test_scores_large_batch(self):
+        """Batches over 10 prospects (the native parallel path) should complete and agree."""
+        from prospect.models import Prospect
+        from prospect.scoring import (
+            calculate_fit_score,
+            calculate_opportunity_score,
+            score_prospects,
+        )
+
+        prospects = [
+            Prospect(
+                name=f"Biz {i}",
+                website=f"https://biz{i}.com.au" if i % 3 else None,
+                phone="0412 345 678" if i % 2 else None,
+                found_in_maps=bool(i % 4),
+                maps_position=i % 5 + 1,
+                rating=3.5 + (i % 3) * 0.5,
+                review_count=i * 2,
+                found_in_organic=bool(i % 2),
+                organic_position=i % 12 + 1,
+            )
+            for i in range(25)
+        ]
+        score_prospects(prospects)
+
+        for prospect in prospects:
+            assert prospect.fit_score == calculate_fit_score(prospect)
+            assert prospect.opportunity_score == calculate_opportunity_score(prospect)
+
+    def test_sets_weighted_priority(self):
+        """Priority should combine fit and opportunity with the given weights."""
+        from prospect.models import Prospect
+        from prospect.scoring import score_prospects
+
+        prospect = Prospect(name="Acme", website="https://acme.com.au")
+        score_prospects([prospect], fit_weight=0.25, opportunity_weight=0.75)
+
+        assert prospect.priority_score == (
+            prospect.fit_score * 0.25 + prospect.opportunity_score * 0.75
+        )
@@ -6,10 +6,21 @@ from prospect.scraper.locations import (
     expand_query_variations,
     haversine_distance,
     location_to_coords,
+    get_location_coordinates,
 )
 from prospect.scraper.orchestrator import SearchOrchestrator, SearchPlan
 
 
+@pytest.fixture
+def db_session(seeded_db):
+    """Session on the seeded database, closed after the test."""
+    from prospect.web.database import SessionLocal
+
+    db = SessionLocal()
+    yield db
+    db.close()
+
+
 class TestLocationExpansion:
     """Test location expansion functionality."""
 
@@ -56,6 +67,12 @@ class TestLocationExpansion:
         # Should default to Brisbane
         assert "27.4698" in coords
 
+    def test_get_location_coordinates(self):
+        """Test exact coordinate lookup by city or suburb name."""
+        assert get_location_coordinates("Brisbane") == (-27.4698, 153.0251)
+        assert get_location_coordinates("  fortitude valley ") == (-27.4568, 153.0358)
+        assert get_location_coordinates("Unknown City") is None
+
 
 class TestQueryExpansion:
     """Test query expansion functionality."""
@@ -165,42 +182,28 @@ class TestSearchPlan:
 class TestSearchConfigModel:
     """Test SearchConfig database model."""
 
-    def test_search_config_seeded(self):
+    def test_search_config_seeded(self, db_session):
         """Test that search configs are seeded on init."""
-        from prospect.web.database import SessionLocal, SearchConfig, init_db
+        from prospect.web.database import SearchConfig
 
-        init_db()
-        db = SessionLocal()
+        configs = db_session.query(SearchConfig).all()
+        names = [c.name for c in configs]
 
-        try:
-            configs = db.query(SearchConfig).all()
-            names = [c.name for c in configs]
+        assert "quick" in names
+        assert "standard" in names
+        assert "deep" in names
+        assert "exhaustive" in names
 
-            assert "quick" in names
-            assert "standard" in names
-            assert "deep" in names
-            assert "exhaustive" in names
-
-        finally:
-            db.close()
-
-    def test_search_config_values(self):
+    def test_search_config_values(self, db_session):
         """Test that config values are correct."""
-        from prospect.web.database import SessionLocal, SearchConfig, init_db
-
-        init_db()
-        db = SessionLocal()
-
-        try:
-            quick = db.query(SearchConfig).filter(SearchConfig.name == "quick").first()
-            assert quick is not None
-            assert quick.max_api_calls == 1
-            assert quick.organic_pages == 1
+        from prospect.web.database import SearchConfig
 
-            exhaustive = db.query(SearchConfig).filter(SearchConfig.name == "exhaustive").first()
-            assert exhaustive is not None
-            assert exhaustive.max_api_calls == 50
-            assert exhaustive.use_location_expansion is True
+        quick = db_session.query(SearchConfig).filter(SearchConfig.name == "quick").first()
+        assert quick is not None
+        assert quick.max_api_calls == 1
+        assert quick.organic_pages == 1
 
-        finally:
-            db.close()
+        exhaustive = db_session.query(SearchConfig).filter(SearchConfig.name == "exhaustive").first()
+        assert exhaustive is not None
+        assert exhaustive.max_api_calls == 50
+        assert exhaustive.use_location_expansion is True
@@ -115,6 +115,36 @@ class TestExceptionTypes:
         assert issubclass(RateLimitError, SerpAPIError)
 
 
+class TestOrganicParsing:
+    """Test organic result parsing."""
+
+    def test_directory_filtering_uses_domain_match(self, monkeypatch):
+        """Directories are dropped without substring false positives."""
+        monkeypatch.setenv("SERPAPI_KEY", "test_key")
+
+        with SerpAPIClient() as client:
+            results = client._parse_organic([
+                {"position": 1, "title": "Acme Plumbing", "link": "https://acmeplumbing.com.au/"},
+                {"position": 2, "title": "Yelp", "link": "https://www.yelp.com.au/biz/acme"},
+                {"position": 3, "title": "Facebook", "link": "https://m.facebook.com/acme"},
+            ])
+
+        assert [r.domain for r in results] == ["acmeplumbing.com.au"]
+
+    def test_directory_filtering_drops_country_variants(self, monkeypatch):
+        """Australian variants of directory domains are dropped too."""
+        monkeypatch.setenv("SERPAPI_KEY", "test_key")
+
+        with SerpAPIClient() as client:
+            results = client._parse_organic([
+                {"position": 1, "title": "Acme Plumbing", "link": "https://acmeplumbing.com.au/"},
+                {"position": 2, "title": "Google", "link": "https://www.google.com.au/search?q=acme"},
+                {"position": 3, "title": "Maps", "link": "https://maps.google.com.au/?cid=1"},
+            ])
+
+        assert [r.domain for r in results] == ["acmeplumbing.com.au"]
+
+
 @pytest.mark.integration
 @pytest.mark.skipif(not os.environ.get("SERPAPI_KEY"), reason="SERPAPI_KEY required")
 class TestSerpAPILive:
@@ -10,7 +10,7 @@ pytest_plugins = ('pytest_asyncio',)
 
 
 @pytest.fixture
-def client():
+def client(seeded_db):
     """Create test client."""
     from fastapi.testclient import TestClient
     app = create_app()
@@ -181,6 +181,24 @@ class TestJobManager:
         updated = await manager.get_job(job.id)
         assert updated.completed_at is not None
 
+    @pytest.mark.asyncio
+    async def test_progress_throttle_coalesces_updates(self):
+        """Should forward the first and final ticks and skip the burst between."""
+        from prospect.web.state import JobManager, ProgressThrottle
+
+        manager = JobManager()
+        job = await manager.create_job("test", "test", 10)
+        throttle = ProgressThrottle(manager, job.id, total=10, interval=60)
+
+        await throttle.tick(1, "one")
+        for i in range(2, 10):
+            await throttle.tick(i, f"item {i}")
+            assert job.progress == 1
+
+        await throttle.tick(10, "done")
+        assert job.progress == 10
+        assert job.progress_message == "done"
+
 
 class TestJobStatus:
     """Test JobStatus enum."""